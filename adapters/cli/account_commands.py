@@ -17,7 +17,11 @@ from rich.table import Table
 from core.domain.entities import AccountStatus, AuthType
 from core.usecases.account_management import AccountManagementUseCase
 from adapters.db.database import initialize_database
-from adapters.db.repositories import AccountRepositoryAdapter, AuthConfigRepositoryAdapter
+from adapters.db.repositories import (
+    AccountRepositoryAdapter,
+    AuthConfigRepositoryAdapter,
+    TokenRepositoryAdapter,
+)
 from adapters.logger import create_logger
 from config.adapters import get_config
 
@@ -71,11 +75,13 @@ def register_account(
             async with db_adapter.get_session() as session:
                 account_repo = AccountRepositoryAdapter(session)
                 auth_config_repo = AuthConfigRepositoryAdapter(session)
+                token_repo = TokenRepositoryAdapter(session)
                 
                 logger = create_logger("account_cli")
                 usecase = AccountManagementUseCase(
                     account_repository=account_repo,
                     auth_config_repository=auth_config_repo,
+                    token_repository=token_repo,
                     logger=logger,
                 )
                 
@@ -142,11 +148,13 @@ def list_accounts(
             async with db_adapter.get_session() as session:
                 account_repo = AccountRepositoryAdapter(session)
                 auth_config_repo = AuthConfigRepositoryAdapter(session)
+                token_repo = TokenRepositoryAdapter(session)
                 
                 logger = create_logger("account_cli")
                 usecase = AccountManagementUseCase(
                     account_repository=account_repo,
                     auth_config_repository=auth_config_repo,
+                    token_repository=token_repo,
                     logger=logger,
                 )
                 
@@ -224,11 +232,13 @@ def get_account(
             async with db_adapter.get_session() as session:
                 account_repo = AccountRepositoryAdapter(session)
                 auth_config_repo = AuthConfigRepositoryAdapter(session)
+                token_repo = TokenRepositoryAdapter(session)
                 
                 logger = create_logger("account_cli")
                 usecase = AccountManagementUseCase(
                     account_repository=account_repo,
                     auth_config_repository=auth_config_repo,
+                    token_repository=token_repo,
                     logger=logger,
                 )
                 
@@ -289,11 +299,13 @@ def delete_account(
             async with db_adapter.get_session() as session:
                 account_repo = AccountRepositoryAdapter(session)
                 auth_config_repo = AuthConfigRepositoryAdapter(session)
+                token_repo = TokenRepositoryAdapter(session)
                 
                 logger = create_logger("account_cli")
                 usecase = AccountManagementUseCase(
                     account_repository=account_repo,
                     auth_config_repository=auth_config_repo,
+                    token_repository=token_repo,
                     logger=logger,
                 )
                 
@@ -372,11 +384,13 @@ def update_account(
             async with db_adapter.get_session() as session:
                 account_repo = AccountRepositoryAdapter(session)
                 auth_config_repo = AuthConfigRepositoryAdapter(session)
+                token_repo = TokenRepositoryAdapter(session)
                 
                 logger = create_logger("account_cli")
                 usecase = AccountManagementUseCase(
                     account_repository=account_repo,
                     auth_config_repository=auth_config_repo,
+                    token_repository=token_repo,
                     logger=logger,
                 )
                 
@@ -17,7 +17,11 @@ from rich.prompt import Confirm
 
 from core.domain.entities import AuthType
 from adapters.db.database import initialize_database
-from adapters.db.repositories import AccountRepositoryAdapter, AuthConfigRepositoryAdapter
+from adapters.db.repositories import (
+    AccountRepositoryAdapter,
+    AuthConfigRepositoryAdapter,
+    TokenRepositoryAdapter,
+)
 from adapters.factory import get_adapter_factory
 from adapters.logger import create_logger
 from config.adapters import get_config
@@ -75,7 +79,7 @@ def poll_device_code_flow(
         help="권한 범위"
     ),
     max_attempts: int = typer.Option(60, "--max-attempts", help="최대 시도 횟수"),
-    interval: int = typer.Option(5, "--interval", help="폴링 간격 (초)"),
+    interval: Optional[int] = typer.Option(None, "--interval", help="폴링 간격 (초, 기본: 서버 지정 값)"),
 ):
     """Device Code Flow 인증을 폴링합니다."""
     asyncio.run(_poll_device_code_flow(device_code, scope, max_attempts, interval))
@@ -437,7 +441,7 @@ async def _start_device_code_flow(email: str, scope: str):
         console.print(f"[red]오류 발생: {str(e)}[/red]")
 
 
-async def _poll_device_code_flow(device_code: str, scope: str, max_attempts: int, interval: int):
+async def _poll_device_code_flow(device_code: str, scope: str, max_attempts: int, interval: Optional[int]):
     """Device Code Flow 폴링"""
     try:
         factory = get_adapter_factory()
@@ -669,12 +673,14 @@ async def _get_auth_config(email: str):
         async with db_adapter.get_session() as session:
             account_repo = AccountRepositoryAdapter(session)
             auth_config_repo = AuthConfigRepositoryAdapter(session)
+            token_repo = TokenRepositoryAdapter(session)
             
             logger = create_logger("auth_cli")
             from core.usecases.account_management import AccountManagementUseCase
             usecase = AccountManagementUseCase(
                 account_repository=account_repo,
                 auth_config_repository=auth_config_repo,
+                token_repository=token_repo,
                 logger=logger,
             )
             
@@ -7,6 +7,8 @@ SQLAlchemy 비동기 엔진과 세션 관리를 담당합니다.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import inspect
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -14,6 +16,26 @@ from core.domain.ports import ConfigPort
 from .models import Base
 
 
+# SQLAlchemy 컴파일 캐시 및 asyncpg 연결별 prepared statement 캐시 크기
+QUERY_CACHE_SIZE = 1024
+PREPARED_STATEMENT_CACHE_SIZE = 1024
+
+
+def _with_statement_cache(url: URL) -> URL:
+    """asyncpg 사용 시 prepared statement 캐시 크기를 URL에 지정합니다."""
+    if url.get_driver_name() != "asyncpg" or "prepared_statement_cache_size" in url.query:
+        return url
+    return url.update_query_dict(
+        {"prepared_statement_cache_size": str(PREPARED_STATEMENT_CACHE_SIZE)}
+    )
+
+
+def _has_all_tables(sync_conn) -> bool:
+    """모델에 정의된 테이블이 모두 생성되어 있는지 확인합니다."""
+    inspector = inspect(sync_conn)
+    return all(inspector.has_table(name) for name in Base.metadata.tables)
+
+
 class DatabaseAdapter:
     """데이터베이스 어댑터"""
     
@@ -24,12 +46,13 @@ class DatabaseAdapter:
     
     async def initialize(self) -> None:
         """데이터베이스 연결을 초기화합니다."""
-        database_url = self.config.get_database_url()
+        database_url = _with_statement_cache(make_url(self.config.get_database_url()))
         
         # 비동기 엔진 생성
         self.engine = create_async_engine(
             database_url,
             echo=False,  # SQL 로깅 (개발 시에만 True)
+            query_cache_size=QUERY_CACHE_SIZE,  # 컴파일된 SQL 캐시
             pool_size=10,
             max_overflow=20,
             pool_pre_ping=True,  # 연결 상태 확인
@@ -59,6 +82,17 @@ class DatabaseAdapter:
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
     
+    async def is_ready(self) -> bool:
+        """데이터베이스 연결과 테이블이 준비되었는지 확인합니다."""
+        if self.engine is None:
+            return False
+        
+        try:
+            async with self.engine.connect() as conn:
+                return await conn.run_sync(_has_all_tables)
+        except Exception:
+            return False
+    
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """데이터베이스 세션을 생성합니다."""
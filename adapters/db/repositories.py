@@ -3,13 +3,15 @@
 
 Core 레이어의 Repository 포트를 구현하는 SQLAlchemy 기반 어댑터들입니다.
 SQLite 호환성을 위해 UUID를 문자열로 변환하여 처리합니다.
+조회 결과는 저장 시 검증을 거친 값이므로 model_construct로 검증 없이 엔티티를 생성합니다.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, desc, or_
+from sqlalchemy import and_, delete, desc, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -22,10 +24,30 @@ from core.domain.entities import (
     DeviceCodeConfig,
     Token,
 )
-from core.domain.ports import AccountRepositoryPort, AuthConfigRepositoryPort, TokenRepositoryPort
+from core.domain.ports import (
+    AccountFilter,
+    AccountRepositoryPort,
+    AuthConfigRepositoryPort,
+    TokenRepositoryPort,
+)
 from .models import AccountModel, AuthCodeConfigModel, DeviceCodeConfigModel, TokenModel
 
 
+# accounts.email UNIQUE 제약 이름 (unique 인덱스 / PostgreSQL 기본 제약 이름)
+_ACCOUNT_EMAIL_UNIQUE_CONSTRAINTS = {"ix_accounts_email", "accounts_email_key"}
+
+
+def _is_duplicate_email_error(error: IntegrityError) -> bool:
+    """IntegrityError가 accounts.email UNIQUE 제약 위반인지 확인합니다."""
+    # SQLite: "UNIQUE constraint failed: accounts.email"
+    if "UNIQUE constraint failed: accounts.email" in str(error.orig):
+        return True
+    
+    # PostgreSQL(asyncpg): 드라이버 원본 예외의 제약 이름으로 판단
+    cause = getattr(error.orig, "__cause__", None)
+    return getattr(cause, "constraint_name", None) in _ACCOUNT_EMAIL_UNIQUE_CONSTRAINTS
+
+
 class AccountRepositoryAdapter(AccountRepositoryPort):
     """계정 Repository 어댑터"""
     
@@ -34,14 +56,7 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
     
     async def create(self, account: Account) -> Account:
         """계정을 생성합니다."""
-        model = AccountModel(
-            id=str(account.id),  # UUID를 문자열로 변환
-            email=account.email,
-            display_name=account.display_name,
-            auth_type=account.auth_type.value,  # Enum을 문자열로 변환
-            status=account.status.value,  # Enum을 문자열로 변환
-            last_sync_at=account.last_sync_at,
-        )
+        model = self._entity_to_model(account)
         
         self.session.add(model)
         await self.session.commit()
@@ -49,6 +64,44 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
         
         return self._model_to_entity(model)
     
+    async def create_with_config(
+        self,
+        account: Account,
+        config: AuthCodeConfig | DeviceCodeConfig,
+    ) -> Account:
+        """계정과 인증 설정을 하나의 트랜잭션으로 생성합니다."""
+        model = self._entity_to_model(account)
+        
+        if isinstance(config, AuthCodeConfig):
+            config_model = AuthCodeConfigModel(
+                account_id=str(config.account_id),
+                client_id=config.client_id,
+                client_secret=config.client_secret,
+                redirect_uri=config.redirect_uri,
+                tenant_id=config.tenant_id,
+            )
+        else:
+            config_model = DeviceCodeConfigModel(
+                account_id=str(config.account_id),
+                client_id=config.client_id,
+                client_secret=config.client_secret,
+                tenant_id=config.tenant_id,
+            )
+        
+        # 두 INSERT를 한 번의 커밋으로 처리 (설정 저장 실패 시 계정도 롤백)
+        self.session.add_all([model, config_model])
+        try:
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            # 이메일 UNIQUE 제약 위반(중복 계정)만 변환하고 그 외 제약 위반은 그대로 전달
+            if _is_duplicate_email_error(e):
+                raise ValueError(f"이미 등록된 계정입니다: {account.email}") from e
+            raise
+        await self.session.refresh(model)
+        
+        return self._model_to_entity(model)
+    
     async def get_by_id(self, account_id: UUID) -> Optional[Account]:
         """ID로 계정을 조회합니다."""
         stmt = select(AccountModel).where(AccountModel.id == str(account_id))
@@ -93,28 +146,66 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
         
         return self._model_to_entity(model)
     
-    async def delete(self, account_id: UUID) -> bool:
-        """계정을 삭제합니다."""
-        stmt = select(AccountModel).where(AccountModel.id == str(account_id))
+    async def update_status(
+        self,
+        account_id: UUID,
+        status: AccountStatus,
+    ) -> Optional[Account]:
+        """계정 상태를 단일 UPDATE ... RETURNING 쿼리로 변경합니다."""
+        stmt = (
+            update(AccountModel)
+            .where(AccountModel.id == str(account_id))
+            .values(status=status.value, updated_at=datetime.utcnow())
+            .returning(AccountModel)
+        )
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
+        await self.session.commit()
         
         if model is None:
-            return False
+            return None
         
-        await self.session.delete(model)
+        return self._model_to_entity(model)
+    
+    async def update_last_sync_at(self, account_id: UUID, last_sync_at: datetime) -> bool:
+        """계정의 마지막 동기화 시간만 단일 UPDATE 쿼리로 변경합니다."""
+        stmt = (
+            update(AccountModel)
+            .where(AccountModel.id == str(account_id))
+            .values(last_sync_at=last_sync_at, updated_at=datetime.utcnow())
+        )
+        result = await self.session.execute(stmt)
         await self.session.commit()
         
-        return True
+        return result.rowcount > 0
     
-    async def list_all(
+    async def delete(self, account_id: UUID) -> bool:
+        """계정을 삭제합니다. (DELETE 한 번으로 처리, 삭제된 행 수로 존재 여부 판단)"""
+        stmt = delete(AccountModel).where(AccountModel.id == str(account_id))
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        
+        return result.rowcount > 0
+    
+    async def list(
         self,
+        filter: AccountFilter,
         skip: int = 0,
-        limit: int = 100,
+        limit: Optional[int] = 100,
     ) -> List[Account]:
-        """모든 계정을 조회합니다."""
+        """조건에 맞는 계정 목록을 조회합니다."""
+        # 모든 목록 조회가 동일한 형태의 바인딩 파라미터 쿼리를 사용하도록 조건을 조합
+        conditions = []
+        if filter.active_only:
+            conditions.append(AccountModel.status == AccountStatus.ACTIVE.value)
+        if filter.status is not None:
+            conditions.append(AccountModel.status == filter.status.value)
+        if filter.auth_type is not None:
+            conditions.append(AccountModel.auth_type == filter.auth_type.value)
+        
         stmt = (
             select(AccountModel)
+            .where(*conditions)
             .order_by(desc(AccountModel.created_at))
             .offset(skip)
             .limit(limit)
@@ -124,17 +215,29 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
         
         return [self._model_to_entity(model) for model in models]
     
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Account]:
+        """모든 계정을 조회합니다."""
+        return await self.list(AccountFilter(), skip=skip, limit=limit)
+    
     async def list_active(self) -> List[Account]:
         """활성 계정 목록을 조회합니다."""
+        return await self.list(AccountFilter(active_only=True), limit=None)
+    
+    async def stream_active(self, batch_size: int = 500) -> AsyncIterator[Account]:
+        """활성 계정을 서버 측 커서로 batch_size 단위로 읽어 반환합니다."""
         stmt = (
             select(AccountModel)
             .where(AccountModel.status == AccountStatus.ACTIVE.value)
             .order_by(desc(AccountModel.created_at))
+            .execution_options(yield_per=batch_size)
         )
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._model_to_entity(model) for model in models]
+        result = await self.session.stream(stmt)
+        async for model in result.scalars():
+            yield self._model_to_entity(model)
     
     async def list_by_status(
         self,
@@ -143,17 +246,7 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
         limit: int = 100,
     ) -> List[Account]:
         """상태별로 계정을 조회합니다."""
-        stmt = (
-            select(AccountModel)
-            .where(AccountModel.status == status.value)
-            .order_by(desc(AccountModel.created_at))
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._model_to_entity(model) for model in models]
+        return await self.list(AccountFilter(status=status), skip=skip, limit=limit)
     
     async def list_by_auth_type(
         self,
@@ -162,17 +255,7 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
         limit: int = 100,
     ) -> List[Account]:
         """인증 타입별로 계정을 조회합니다."""
-        stmt = (
-            select(AccountModel)
-            .where(AccountModel.auth_type == auth_type.value)
-            .order_by(desc(AccountModel.created_at))
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._model_to_entity(model) for model in models]
+        return await self.list(AccountFilter(auth_type=auth_type), skip=skip, limit=limit)
     
     async def exists_by_email(self, email: str) -> bool:
         """이메일로 계정 존재 여부를 확인합니다."""
@@ -206,9 +289,21 @@ class AccountRepositoryAdapter(AccountRepositoryPort):
         
         return [self._model_to_entity(model) for model in models]
     
-    def _model_to_entity(self, model: AccountModel) -> Account:
+    def _entity_to_model(self, account: Account) -> AccountModel:
+        """엔티티를 모델로 변환합니다."""
+        return AccountModel(
+            id=str(account.id),  # UUID를 문자열로 변환
+            email=account.email,
+            display_name=account.display_name,
+            auth_type=account.auth_type.value,  # Enum을 문자열로 변환
+            status=account.status.value,  # Enum을 문자열로 변환
+            last_sync_at=account.last_sync_at,
+        )
+    
+    @staticmethod
+    def _model_to_entity(model: AccountModel) -> Account:
         """모델을 엔티티로 변환합니다."""
-        return Account(
+        return Account.model_construct(
             id=UUID(model.id),  # 문자열을 UUID로 변환
             email=model.email,
             display_name=model.display_name,
@@ -349,41 +444,88 @@ class AuthConfigRepositoryAdapter(AuthConfigRepositoryPort):
         
         return self._device_code_model_to_entity(model)
     
+    async def get_config_for_account(
+        self, account_id: UUID
+    ) -> Optional[AuthCodeConfig | DeviceCodeConfig]:
+        """계정의 인증 타입에 맞는 인증 설정을 단일 JOIN 쿼리로 조회합니다."""
+        configs = await self.get_configs_for_accounts([account_id])
+        return configs.get(account_id)
+    
+    async def get_account_with_config(
+        self, account_id: UUID
+    ) -> Tuple[Optional[Account], Optional[AuthCodeConfig | DeviceCodeConfig]]:
+        """계정과 해당 인증 타입의 설정을 단일 JOIN 쿼리로 함께 조회합니다."""
+        stmt = (
+            select(AccountModel, AuthCodeConfigModel, DeviceCodeConfigModel)
+            .outerjoin(AuthCodeConfigModel, AuthCodeConfigModel.account_id == AccountModel.id)
+            .outerjoin(DeviceCodeConfigModel, DeviceCodeConfigModel.account_id == AccountModel.id)
+            .where(AccountModel.id == str(account_id))
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        
+        if row is None:
+            return None, None
+        
+        account_model, auth_code_model, device_code_model = row
+        account = AccountRepositoryAdapter._model_to_entity(account_model)
+        
+        config = None
+        if account.auth_type == AuthType.AUTHORIZATION_CODE and auth_code_model is not None:
+            config = self._auth_code_model_to_entity(auth_code_model)
+        elif account.auth_type == AuthType.DEVICE_CODE and device_code_model is not None:
+            config = self._device_code_model_to_entity(device_code_model)
+        
+        return account, config
+    
+    async def get_configs_for_accounts(
+        self, account_ids: List[UUID]
+    ) -> Dict[UUID, AuthCodeConfig | DeviceCodeConfig]:
+        """여러 계정의 인증 설정을 단일 JOIN 쿼리로 일괄 조회합니다."""
+        if not account_ids:
+            return {}
+        
+        stmt = (
+            select(AccountModel.id, AccountModel.auth_type, AuthCodeConfigModel, DeviceCodeConfigModel)
+            .outerjoin(AuthCodeConfigModel, AuthCodeConfigModel.account_id == AccountModel.id)
+            .outerjoin(DeviceCodeConfigModel, DeviceCodeConfigModel.account_id == AccountModel.id)
+            .where(AccountModel.id.in_([str(account_id) for account_id in account_ids]))
+        )
+        result = await self.session.execute(stmt)
+        
+        configs: Dict[UUID, AuthCodeConfig | DeviceCodeConfig] = {}
+        for account_id, auth_type, auth_code_model, device_code_model in result.all():
+            # 계정의 인증 타입에 해당하는 설정만 엔티티로 변환
+            if auth_type == AuthType.AUTHORIZATION_CODE.value and auth_code_model is not None:
+                configs[UUID(account_id)] = self._auth_code_model_to_entity(auth_code_model)
+            elif auth_type == AuthType.DEVICE_CODE.value and device_code_model is not None:
+                configs[UUID(account_id)] = self._device_code_model_to_entity(device_code_model)
+        
+        return configs
+    
     async def delete_auth_code_config(self, account_id: UUID) -> bool:
         """Authorization Code 설정을 삭제합니다."""
-        stmt = select(AuthCodeConfigModel).where(
+        stmt = delete(AuthCodeConfigModel).where(
             AuthCodeConfigModel.account_id == str(account_id)
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        
-        if model is None:
-            return False
-        
-        await self.session.delete(model)
         await self.session.commit()
         
-        return True
+        return result.rowcount > 0
     
     async def delete_device_code_config(self, account_id: UUID) -> bool:
         """Device Code 설정을 삭제합니다."""
-        stmt = select(DeviceCodeConfigModel).where(
+        stmt = delete(DeviceCodeConfigModel).where(
             DeviceCodeConfigModel.account_id == str(account_id)
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        
-        if model is None:
-            return False
-        
-        await self.session.delete(model)
         await self.session.commit()
         
-        return True
+        return result.rowcount > 0
     
     def _auth_code_model_to_entity(self, model: AuthCodeConfigModel) -> AuthCodeConfig:
         """Authorization Code 모델을 엔티티로 변환합니다."""
-        return AuthCodeConfig(
+        return AuthCodeConfig.model_construct(
             account_id=UUID(model.account_id),
             client_id=model.client_id,
             client_secret=model.client_secret,
@@ -395,7 +537,7 @@ class AuthConfigRepositoryAdapter(AuthConfigRepositoryPort):
         """Device Code 모델을 엔티티로 변환합니다."""
         print(f"[DB] Device Code 모델→엔티티 변환 - client_secret: {'있음' if model.client_secret else '없음'}")
         
-        entity = DeviceCodeConfig(
+        entity = DeviceCodeConfig.model_construct(
             account_id=UUID(model.account_id),
             client_id=model.client_id,
             client_secret=model.client_secret,
@@ -461,18 +603,12 @@ class TokenRepositoryAdapter(TokenRepositoryPort):
         return await self.save(token)
     
     async def delete(self, account_id: UUID) -> bool:
-        """토큰을 삭제합니다."""
-        stmt = select(TokenModel).where(TokenModel.account_id == str(account_id))
+        """토큰을 삭제합니다. (DELETE 한 번으로 처리, 삭제된 행 수로 존재 여부 판단)"""
+        stmt = delete(TokenModel).where(TokenModel.account_id == str(account_id))
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        
-        if model is None:
-            return False
-        
-        await self.session.delete(model)
         await self.session.commit()
         
-        return True
+        return result.rowcount > 0
     
     async def list_expired_tokens(self) -> List[Token]:
         """만료된 토큰 목록을 조회합니다."""
@@ -500,7 +636,7 @@ class TokenRepositoryAdapter(TokenRepositoryPort):
     
     def _model_to_entity(self, model: TokenModel) -> Token:
         """모델을 엔티티로 변환합니다."""
-        return Token(
+        return Token.model_construct(
             account_id=UUID(model.account_id),
             access_token=model.access_token,
             refresh_token=model.refresh_token,
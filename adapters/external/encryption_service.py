@@ -6,7 +6,7 @@ Fernet 대칭 암호화를 사용합니다.
 """
 
 import base64
-from typing import Optional
+from typing import List, Optional
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -56,15 +56,7 @@ class EncryptionServiceAdapter(EncryptionServicePort):
     async def decrypt(self, encrypted_data: str) -> str:
         """암호화된 데이터를 복호화합니다."""
         try:
-            if not encrypted_data:
-                return ""
-            
-            # Base64 디코딩
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-            
-            # 복호화
-            decrypted_data = self._fernet.decrypt(encrypted_bytes)
-            result = decrypted_data.decode()
+            result = self._decrypt_value(encrypted_data)
             
             self.logger.debug("데이터 복호화 성공")
             return result
@@ -73,6 +65,30 @@ class EncryptionServiceAdapter(EncryptionServicePort):
             self.logger.error(f"데이터 복호화 실패: {str(e)}")
             raise Exception(f"복호화 실패: {str(e)}")
     
+    async def decrypt_many(self, encrypted_values: List[str]) -> List[str]:
+        """여러 암호화된 데이터를 한 번에 복호화합니다."""
+        try:
+            # 로컬 Fernet 복호화이므로 순서대로 처리
+            results = [self._decrypt_value(value) for value in encrypted_values]
+            
+            self.logger.debug(f"데이터 {len(results)}건 복호화 성공")
+            return results
+        
+        except Exception as e:
+            self.logger.error(f"데이터 복호화 실패: {str(e)}")
+            raise Exception(f"복호화 실패: {str(e)}")
+    
+    def _decrypt_value(self, encrypted_data: str) -> str:
+        """암호화된 값 하나를 복호화합니다."""
+        if not encrypted_data:
+            return ""
+        
+        # Base64 디코딩
+        encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
+        
+        # 복호화
+        return self._fernet.decrypt(encrypted_bytes).decode()
+    
     def verify_key(self, test_data: str = "test_encryption") -> bool:
         """암호화 키가 올바른지 검증합니다."""
         try:
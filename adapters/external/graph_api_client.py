@@ -5,24 +5,104 @@ Microsoft Graph API와의 통신을 담당하는 어댑터입니다.
 OAuth 2.0 인증 플로우와 메일 관련 API를 구현합니다.
 """
 
+import asyncio
 import json
-from typing import Dict, List, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import httpx
 
-from core.domain.ports import GraphApiClientPort, LoggerPort
+from core.domain.ports import (
+    AccessDeniedError,
+    AuthorizationPendingError,
+    ExpiredTokenError,
+    GraphApiClientPort,
+    LoggerPort,
+    SlowDownError,
+)
+
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원에 필요)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# 같은 사서함에 동시에 보낼 수 있는 요청 수 (Outlook 리소스 제한, 초과 시 429)
+GRAPH_MAILBOX_MAX_CONCURRENCY = 4
+
+# 제한(429/503)된 $batch 하위 요청 재시도 횟수와 Retry-After가 없을 때의 대기 시간(초)
+GRAPH_BATCH_MAX_RETRIES = 3
+GRAPH_BATCH_DEFAULT_RETRY_AFTER = 2.0
+
+# 공유 HTTP 클라이언트 커넥션 풀 설정
+HTTP_CONNECT_TIMEOUT = 3.0
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+
+# 동시에 진행할 수 있는 Graph API 호출 수 (초과 요청은 대기하여 429 재시도 폭주를 방지)
+GRAPH_MAX_CONCURRENCY = 8
+GRAPH_CONCURRENCY_WAIT_WARN_SECONDS = 1.0
+
+# Device Code 폴링 OAuth 오류 코드별 예외 타입
+_DEVICE_CODE_POLL_ERRORS = {
+    error.error_code: error
+    for error in (AuthorizationPendingError, SlowDownError, AccessDeniedError, ExpiredTokenError)
+}
 
 
 class GraphApiClientAdapter(GraphApiClientPort):
     """Microsoft Graph API 클라이언트 어댑터"""
     
+    # 어댑터는 요청마다 생성되므로 HTTP 커넥션 풀은 프로세스 전역(이벤트 루프별 1개)으로 공유
+    _shared_client: Optional[httpx.AsyncClient] = None
+    _shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+    _shared_semaphore: Optional[asyncio.Semaphore] = None
+    
     def __init__(self, logger: LoggerPort):
         self.logger = logger
         self.base_url = "https://graph.microsoft.com/v1.0"
         self.auth_url = "https://login.microsoftonline.com"
         self.timeout = 30.0
     
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """공유 HTTP 클라이언트를 반환합니다. (블록 종료 시 닫지 않음, 동시 호출 수 제한)"""
+        loop = asyncio.get_running_loop()
+        cls = GraphApiClientAdapter
+        
+        # 다른 이벤트 루프에서 만든 클라이언트는 재사용할 수 없으므로 새로 생성
+        if cls._shared_client is None or cls._shared_client.is_closed or cls._shared_client_loop is not loop:
+            cls._shared_client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(self.timeout, connect=HTTP_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+            cls._shared_client_loop = loop
+            cls._shared_semaphore = asyncio.Semaphore(GRAPH_MAX_CONCURRENCY)
+        
+        # 동시 호출 수 제한 (대기가 길어지면 포화 상태로 보고 경고)
+        semaphore = cls._shared_semaphore
+        started = time.monotonic()
+        async with semaphore:
+            waited = time.monotonic() - started
+            if waited > GRAPH_CONCURRENCY_WAIT_WARN_SECONDS:
+                self.logger.warning(f"Graph API 동시 호출 한도 대기: {waited:.2f}초")
+            yield cls._shared_client
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """공유 HTTP 클라이언트를 닫습니다."""
+        if cls._shared_client is not None:
+            await cls._shared_client.aclose()
+            cls._shared_client = None
+            cls._shared_client_loop = None
+            cls._shared_semaphore = None
+    
     async def get_authorization_url(
         self,
         client_id: str,
@@ -64,7 +144,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "scope": scope,
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 url,
                 data=data,
@@ -101,7 +181,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "grant_type": "authorization_code",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 url,
                 data=data,
@@ -143,7 +223,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
         self.logger.info(f"[DEBUG] Device Code 폴링 요청 데이터: {data}")
         self.logger.info(f"[DEBUG] client_secret 포함 여부: {bool(client_secret)}")
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 url,
                 data=data,
@@ -155,9 +235,11 @@ class GraphApiClientAdapter(GraphApiClientPort):
                 error_code = error_data.get("error", "unknown_error")
                 error_description = error_data.get("error_description", response.text)
                 
-                # 특정 오류는 예외로 처리하지 않고 상위에서 처리하도록 함
-                if error_code in ["authorization_pending", "slow_down", "access_denied", "expired_token"]:
-                    raise Exception(error_code)
+                # 폴링 상태를 나타내는 오류는 상위에서 분기할 수 있도록 오류 코드별 예외로 전달
+                poll_error = _DEVICE_CODE_POLL_ERRORS.get(error_code)
+                if poll_error is not None:
+                    retry_after = response.headers.get("Retry-After", "")
+                    raise poll_error(retry_after=int(retry_after) if retry_after.isdigit() else None)
                 
                 error_msg = f"디바이스 코드 폴링 실패: {response.status_code} - {error_description}"
                 self.logger.error(error_msg)
@@ -189,7 +271,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
         if client_secret:
             data["client_secret"] = client_secret
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 url,
                 data=data,
@@ -216,7 +298,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(url, headers=headers)
             
             if response.status_code != 200:
@@ -235,6 +317,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
         skip: int = 0,
         filter_query: Optional[str] = None,
         order_by: Optional[str] = None,
+        select: Optional[List[str]] = None,
     ) -> dict:
         """메시지 목록을 조회합니다."""
         self.logger.debug(f"메시지 목록 조회: top={top}, skip={skip}")
@@ -254,12 +337,15 @@ class GraphApiClientAdapter(GraphApiClientPort):
         else:
             params["$orderby"] = "receivedDateTime desc"
         
+        if select:
+            params["$select"] = ",".join(select)
+        
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(url, headers=headers, params=params)
             
             if response.status_code != 200:
@@ -272,19 +358,115 @@ class GraphApiClientAdapter(GraphApiClientPort):
             self.logger.debug(f"메시지 목록 조회 성공: {message_count}개 메시지")
             return result
     
-    async def get_message(self, access_token: str, message_id: str) -> dict:
+    async def batch_list_messages(
+        self,
+        access_token: str,
+        pages: List[Tuple[int, int]],
+        order_by: Optional[str] = None,
+        select: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """
+        여러 페이지의 메시지 목록을 JSON $batch 요청 한 번으로 조회합니다.
+        
+        하위 요청은 모두 같은 사서함으로 동시에 실행되므로 사서함 동시 요청 한도를 넘을 수 없습니다.
+        제한(429/503)된 하위 요청은 Retry-After만큼 기다린 뒤 해당 요청만 다시 보냅니다.
+        """
+        if len(pages) > GRAPH_MAILBOX_MAX_CONCURRENCY:
+            raise ValueError(
+                f"$batch 요청은 사서함 동시 요청 한도인 {GRAPH_MAILBOX_MAX_CONCURRENCY}개까지 가능합니다: {len(pages)}"
+            )
+        
+        self.logger.debug(f"메시지 목록 배치 조회: {len(pages)}개 페이지")
+        
+        url = f"{self.base_url}/$batch"
+        
+        pending = {}
+        for i, (top, skip) in enumerate(pages):
+            params = {
+                "$top": top,
+                "$skip": skip,
+                "$orderby": order_by or "receivedDateTime desc",
+            }
+            if select:
+                params["$select"] = ",".join(select)
+            pending[str(i)] = {
+                "id": str(i),
+                "method": "GET",
+                "url": f"/me/messages?{urlencode(params, safe='$')}",
+            }
+        
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        
+        bodies: Dict[str, dict] = {}
+        # 첫 요청과 재시도를 합쳐 전체 반복 횟수를 제한 (응답에서 빠진 하위 요청도 재시도 대상)
+        for attempt in range(GRAPH_BATCH_MAX_RETRIES + 1):
+            async with self._client() as client:
+                response = await client.post(url, headers=headers, json={"requests": list(pending.values())})
+            
+            if response.status_code != 200:
+                error_msg = f"메시지 목록 배치 조회 실패: {response.status_code} - {response.text}"
+                self.logger.error(error_msg)
+                raise Exception(error_msg)
+            
+            retry_after = 0.0
+            for result in response.json().get("responses", []):
+                request_id = result.get("id")
+                status = result.get("status")
+                if status == 200:
+                    bodies[request_id] = result.get("body", {})
+                    pending.pop(request_id, None)
+                elif status in (429, 503):
+                    child_retry_after = (result.get("headers") or {}).get("Retry-After", "")
+                    retry_after = max(
+                        retry_after,
+                        float(child_retry_after) if child_retry_after.isdigit() else GRAPH_BATCH_DEFAULT_RETRY_AFTER,
+                    )
+                else:
+                    error_msg = f"메시지 목록 배치 조회 실패: 요청 {request_id} - {status} - {result.get('body')}"
+                    self.logger.error(error_msg)
+                    raise Exception(error_msg)
+            
+            if not pending or attempt == GRAPH_BATCH_MAX_RETRIES:
+                break
+            
+            # 제한되었거나 응답이 없는 하위 요청만 Retry-After 이후 재시도 (대기 중에는 동시 호출 슬롯을 점유하지 않음)
+            self.logger.warning(
+                f"메시지 목록 배치 조회 제한: {len(pending)}개 요청을 {retry_after:.0f}초 후 재시도 ({attempt + 1}/{GRAPH_BATCH_MAX_RETRIES})"
+            )
+            await asyncio.sleep(retry_after)
+        
+        if pending:
+            error_msg = f"메시지 목록 배치 조회 실패: 재시도 후에도 응답이 없는 요청 {sorted(pending)}"
+            self.logger.error(error_msg)
+            raise Exception(error_msg)
+        
+        self.logger.debug(f"메시지 목록 배치 조회 성공: {len(bodies)}개 페이지")
+        # 하위 응답은 순서가 보장되지 않으므로 요청 순서대로 정렬
+        return [bodies[str(i)] for i in range(len(pages))]
+    
+    async def get_message(
+        self,
+        access_token: str,
+        message_id: str,
+        select: Optional[List[str]] = None,
+    ) -> dict:
         """특정 메시지를 조회합니다."""
         self.logger.debug(f"메시지 조회: message_id={message_id}")
         
         url = f"{self.base_url}/me/messages/{message_id}"
         
+        params = {"$select": ",".join(select)} if select else None
+        
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, headers=headers)
+        async with self._client() as client:
+            response = await client.get(url, headers=headers, params=params)
             
             if response.status_code != 200:
                 error_msg = f"메시지 조회 실패: {response.status_code} - {response.text}"
@@ -306,7 +488,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 url,
                 headers=headers,
@@ -332,7 +514,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(delta_link, headers=headers)
             
             if response.status_code != 200:
@@ -345,6 +527,27 @@ class GraphApiClientAdapter(GraphApiClientPort):
             self.logger.debug(f"델타 메시지 조회 성공: {message_count}개 변경사항")
             return result
     
+    async def get_next_page(self, access_token: str, url: str) -> dict:
+        """@odata.nextLink로 다음 페이지를 조회합니다."""
+        self.logger.debug("다음 페이지 조회")
+        
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        
+        async with self._client() as client:
+            response = await client.get(url, headers=headers)
+            
+            if response.status_code != 200:
+                error_msg = f"다음 페이지 조회 실패: {response.status_code} - {response.text}"
+                self.logger.error(error_msg)
+                raise Exception(error_msg)
+            
+            result = response.json()
+            self.logger.debug(f"다음 페이지 조회 성공: {len(result.get('value', []))}개 항목")
+            return result
+    
     async def create_subscription(
         self,
         access_token: str,
@@ -374,7 +577,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 url,
                 headers=headers,
@@ -410,7 +613,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.patch(
                 url,
                 headers=headers,
@@ -441,7 +644,7 @@ class GraphApiClientAdapter(GraphApiClientPort):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.delete(url, headers=headers)
             
             if response.status_code != 204:
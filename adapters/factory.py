@@ -102,11 +102,13 @@ class AdapterFactory:
         """계정 관리 유즈케이스를 생성합니다."""
         account_repository = self.create_account_repository(session)
         auth_config_repository = self.create_auth_config_repository(session)
+        token_repository = self.create_token_repository(session)
         logger = self.create_logger()
         
         return AccountManagementUseCase(
             account_repository=account_repository,
             auth_config_repository=auth_config_repository,
+            token_repository=token_repository,
             logger=logger,
         )
     
@@ -128,6 +130,7 @@ class AdapterFactory:
             encryption_service=encryption_service,
             cache_service=cache_service,
             logger=logger,
+            state_secret=self.config.get_oauth_state_secret(),
         )
     
     def get_database_adapter(self) -> DatabaseAdapter:
@@ -27,21 +27,25 @@ class LoggerAdapter(LoggerPort):
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
     
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """정보 로그"""
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, *args, extra=kwargs)
     
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, exc_info: bool = False, **kwargs) -> None:
         """경고 로그"""
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, *args, exc_info=exc_info, extra=kwargs)
     
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, exc_info: bool = False, **kwargs) -> None:
         """오류 로그"""
-        self.logger.error(message, extra=kwargs)
+        self.logger.error(message, *args, exc_info=exc_info, extra=kwargs)
     
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """디버그 로그"""
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, *args, extra=kwargs)
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨 로그 출력 여부"""
+        return self.logger.isEnabledFor(level)
 
 
 def create_logger(name: str = "graphapi", level: str = "INFO") -> LoggerPort:
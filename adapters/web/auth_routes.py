@@ -83,6 +83,7 @@ async def start_auth(
             encryption_service=encryption_service,
             cache_service=cache_service,
             logger=logger,
+            state_secret=config.get_oauth_state_secret(),
         )
         
         if flow == "authorization_code":
@@ -223,6 +224,7 @@ async def auth_callback(
             encryption_service=encryption_service,
             cache_service=cache_service,
             logger=logger,
+            state_secret=config.get_oauth_state_secret(),
         )
         
         # 인증 완료 처리
@@ -329,6 +331,7 @@ async def poll_device_code(
             encryption_service=encryption_service,
             cache_service=cache_service,
             logger=logger,
+            state_secret=config.get_oauth_state_secret(),
         )
         
         # 폴링 시도 (한 번만)
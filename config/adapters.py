@@ -5,7 +5,9 @@ Redis를 제거하고 웹 서버 설정을 추가한 설정 어댑터입니다.
 """
 
 import os
-from typing import Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
 
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
@@ -13,8 +15,8 @@ from pydantic import Field, validator
 from core.domain.ports import ConfigPort
 
 
-class BaseConfig(BaseSettings, ConfigPort):
-    """기본 설정 클래스"""
+class BaseConfig(BaseSettings):
+    """기본 설정 클래스 (ConfigPort 프로토콜을 구조적으로 구현)"""
     
     # 환경 설정
     environment: str = Field(default="development", env="ENVIRONMENT")
@@ -64,6 +66,11 @@ class BaseConfig(BaseSettings, ConfigPort):
     web_host: str = Field(default="0.0.0.0", env="WEB_HOST")
     web_port: int = Field(default=5000, env="WEB_PORT")
     web_workers: int = Field(default=1, env="WEB_WORKERS")
+    web_threadpool_tokens: int = Field(default=100, env="WEB_THREADPOOL_TOKENS")  # 동기 핸들러/의존성용 스레드 수
+    web_cors_origins: str = Field(
+        default="http://localhost:5000",  # 쉼표로 구분된 허용 오리진 목록
+        env="WEB_CORS_ORIGINS"
+    )
     
     # API 서버 설정 (향후 REST API용)
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
@@ -159,6 +166,12 @@ class BaseConfig(BaseSettings, ConfigPort):
     def get_web_workers(self) -> int:
         return self.web_workers
     
+    def get_web_threadpool_tokens(self) -> int:
+        return self.web_threadpool_tokens
+    
+    def get_web_cors_origins(self) -> List[str]:
+        return [origin.strip() for origin in self.web_cors_origins.split(",") if origin.strip()]
+    
     def get_api_host(self) -> str:
         return self.api_host
     
@@ -174,36 +187,53 @@ class BaseConfig(BaseSettings, ConfigPort):
     def get_sync_interval_minutes(self) -> int:
         return self.sync_interval_minutes
     
-    def get_azure_config(self) -> dict:
-        """Azure 설정 조회"""
-        return {
+    # 복합 설정은 최초 조회 시 한 번만 구성하고 읽기 전용 뷰로 공유
+    @cached_property
+    def _azure_config(self) -> Mapping[str, Any]:
+        return MappingProxyType({
             "client_id": self.azure_client_id,
             "client_secret": self.azure_client_secret,
             "tenant_id": self.azure_tenant_id,
-        }
+        })
     
-    def get_web_config(self) -> dict:
-        """웹 서버 설정 조회"""
-        return {
+    @cached_property
+    def _web_config(self) -> Mapping[str, Any]:
+        return MappingProxyType({
             "host": self.web_host,
             "port": self.web_port,
             "workers": self.web_workers,
-        }
+        })
     
-    def get_api_config(self) -> dict:
-        """API 설정 조회"""
-        return {
+    @cached_property
+    def _api_config(self) -> Mapping[str, Any]:
+        return MappingProxyType({
             "host": self.api_host,
             "port": self.api_port,
             "workers": self.api_workers,
-        }
+        })
     
-    def get_log_config(self) -> dict:
-        """로그 설정 조회"""
-        return {
+    @cached_property
+    def _log_config(self) -> Mapping[str, Any]:
+        return MappingProxyType({
             "level": self.log_level,
             "format": self.log_format,
-        }
+        })
+    
+    def get_azure_config(self) -> Mapping[str, Any]:
+        """Azure 설정 조회 (읽기 전용)"""
+        return self._azure_config
+    
+    def get_web_config(self) -> Mapping[str, Any]:
+        """웹 서버 설정 조회 (읽기 전용)"""
+        return self._web_config
+    
+    def get_api_config(self) -> Mapping[str, Any]:
+        """API 설정 조회 (읽기 전용)"""
+        return self._api_config
+    
+    def get_log_config(self) -> Mapping[str, Any]:
+        """로그 설정 조회 (읽기 전용)"""
+        return self._log_config
 
 
 class DevelopmentConfig(BaseConfig):
@@ -5,13 +5,24 @@
 모든 엔티티는 Pydantic 모델을 기반으로 하여 타입 안정성을 보장합니다.
 """
 
+import base64
+import copy
+import hashlib
+import json
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, validator
 
+try:
+    # 설치되어 있으면 더 빠른 orjson 사용 (pip install .[fast])
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # 서울 시간대 정의
 KST = timezone(timedelta(hours=9))
 
@@ -20,6 +31,74 @@ def now_kst() -> datetime:
     return datetime.now(KST).replace(tzinfo=None)
 
 
+# base64url 패딩 문자 (필요한 개수만큼 잘라서 사용)
+_B64_PAD = '==='
+
+
+def _b64url_decode(part: str) -> bytes:
+    """패딩이 생략된 base64url 문자열을 디코딩합니다."""
+    # -len & 3 == (-len) % 4 : 이미 4의 배수 길이면 패딩을 붙이지 않음
+    return base64.urlsafe_b64decode(part + _B64_PAD[:-len(part) & 3])
+
+
+# JWT 파싱 결과 캐시 최대 항목 수 (LRU)
+_JWT_CACHE_SIZE = 4096
+
+# 토큰 다이제스트별 (header, payload, 만료 시간) - 평문 토큰이 메모리에 남지 않도록 다이제스트를 키로 사용
+_jwt_cache: "OrderedDict[bytes, Tuple[dict, dict, Optional[datetime]]]" = OrderedDict()
+
+
+def _parse_jwt_cached(token: str) -> Optional[Tuple[dict, dict, Optional[datetime]]]:
+    """
+    JWT를 파싱하고 결과를 캐시합니다.
+    
+    반환값은 캐시와 공유되므로 호출자는 dict를 수정하지 않아야 합니다.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    parsed = _jwt_cache.get(key)
+    if parsed is not None:
+        _jwt_cache.move_to_end(key)
+        return parsed
+    
+    try:
+        # JWT는 header.payload.signature 형태
+        parts = token.split('.')
+        if len(parts) != 3:
+            return None
+        
+        header = _json_loads(_b64url_decode(parts[0]))
+        payload = _json_loads(_b64url_decode(parts[1]))
+        
+        expiry = None
+        if 'exp' in payload:
+            # UTC 시간을 서울 시간으로 변환
+            utc_time = datetime.fromtimestamp(payload['exp'], tz=timezone.utc)
+            expiry = utc_time.astimezone(KST).replace(tzinfo=None)
+    except Exception:
+        return None
+    
+    parsed = (header, payload, expiry)
+    _jwt_cache[key] = parsed
+    if len(_jwt_cache) > _JWT_CACHE_SIZE:
+        _jwt_cache.popitem(last=False)
+    return parsed
+
+
+def parse_jwt(token: str) -> Optional[Tuple[dict, dict, Optional[datetime]]]:
+    """
+    JWT를 (header, payload, 만료 시간(서울 시간)) 으로 파싱합니다.
+    
+    파싱 결과는 캐시되며, 호출자가 수정해도 캐시에 영향이 없도록 dict는 복사본을 반환합니다.
+    JWT 형식이 아니거나 파싱에 실패하면 None을 반환합니다.
+    """
+    parsed = _parse_jwt_cached(token)
+    if parsed is None:
+        return None
+    
+    header, payload, expiry = parsed
+    return copy.deepcopy(header), copy.deepcopy(payload), expiry
+
+
 class AuthType(str, Enum):
     """인증 방식"""
     AUTHORIZATION_CODE = "authorization_code"
@@ -68,6 +147,10 @@ class Account(BaseModel):
             raise ValueError('유효한 이메일 주소가 아닙니다')
         return v.lower()
     
+    def __hash__(self) -> int:
+        """계정 ID 기반 해시 (set/dict 중복 제거용)"""
+        return hash(self.id)
+    
     def is_active(self) -> bool:
         """계정이 활성 상태인지 확인"""
         return self.status == AccountStatus.ACTIVE
@@ -132,6 +215,10 @@ class Token(BaseModel):
     created_at: datetime = Field(default_factory=now_kst, description="생성 시간")
     updated_at: datetime = Field(default_factory=now_kst, description="수정 시간")
     
+    def __hash__(self) -> int:
+        """계정 ID 기반 해시 (계정당 토큰 하나)"""
+        return hash(self.account_id)
+    
     def is_expired(self) -> bool:
         """토큰이 만료되었는지 확인"""
         return now_kst() >= self.expires_at
@@ -156,31 +243,9 @@ class Token(BaseModel):
     
     def extract_jwt_expiry(self, decrypted_token: str) -> Optional[datetime]:
         """JWT 토큰에서 실제 만료 시간 추출 (서울 시간으로 변환)"""
-        try:
-            import json
-            import base64
-            
-            # JWT는 header.payload.signature 형태
-            parts = decrypted_token.split('.')
-            if len(parts) != 3:
-                return None
-            
-            # payload 부분 디코딩 (base64url)
-            payload = parts[1]
-            # base64url 패딩 추가
-            payload += '=' * (4 - len(payload) % 4)
-            decoded_bytes = base64.urlsafe_b64decode(payload)
-            payload_data = json.loads(decoded_bytes.decode('utf-8'))
-            
-            if 'exp' in payload_data:
-                # UTC 시간을 서울 시간으로 변환
-                utc_time = datetime.fromtimestamp(payload_data['exp'], tz=timezone.utc)
-                kst_time = utc_time.astimezone(KST).replace(tzinfo=None)
-                return kst_time
-            
-            return None
-        except Exception:
-            return None
+        # 만료 시간만 필요하므로 dict 복사 없이 캐시된 결과를 바로 사용
+        parsed = _parse_jwt_cached(decrypted_token)
+        return parsed[2] if parsed else None
     
     def is_expired_by_jwt(self, decrypted_token: str) -> bool:
         """JWT 토큰의 실제 만료 시간으로 만료 여부 확인"""
@@ -278,6 +343,10 @@ class WebhookSubscription(BaseModel):
     client_state: Optional[str] = Field(None, description="클라이언트 상태")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="생성 시간")
     
+    def __hash__(self) -> int:
+        """구독 ID 기반 해시 (set/dict 중복 제거용)"""
+        return hash(self.id)
+    
     def is_expired(self) -> bool:
         """구독이 만료되었는지 확인"""
         return datetime.utcnow() >= self.expires_at
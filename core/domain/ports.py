@@ -2,17 +2,19 @@
 포트 인터페이스 정의
 
 클린 아키텍처의 핵심으로, Core 레이어와 외부 어댑터 간의 계약을 정의합니다.
-모든 포트는 추상 기본 클래스(ABC)로 정의되어 구현을 강제합니다.
+모든 포트는 typing.Protocol로 정의되어 구조적 타이핑으로 구현을 검사합니다.
 """
 
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Protocol, Set, Tuple
 from uuid import UUID
 
 from .entities import (
     Account,
+    AccountStatus,
     AuthCodeConfig,
+    AuthType,
     DeviceCodeConfig,
     DeltaLink,
     Mail,
@@ -22,137 +24,171 @@ from .entities import (
 )
 
 
-class AccountRepositoryPort(ABC):
+@dataclass(slots=True)
+class AccountFilter:
+    """계정 목록 조회 조건"""
+    
+    status: Optional[AccountStatus] = None
+    auth_type: Optional[AuthType] = None
+    active_only: bool = False
+
+
+class AccountRepositoryPort(Protocol):
     """계정 저장소 포트"""
     
-    @abstractmethod
     async def create(self, account: Account) -> Account:
         """계정 생성"""
-        pass
+        ...
+    
+    async def create_with_config(
+        self,
+        account: Account,
+        config: AuthCodeConfig | DeviceCodeConfig,
+    ) -> Account:
+        """계정과 인증 설정을 단일 트랜잭션으로 생성 (이메일 중복 시 ValueError)"""
+        ...
     
-    @abstractmethod
     async def get_by_id(self, account_id: UUID) -> Optional[Account]:
         """ID로 계정 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_email(self, email: str) -> Optional[Account]:
         """이메일로 계정 조회"""
-        pass
+        ...
+    
+    async def list(
+        self,
+        filter: AccountFilter,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Account]:
+        """조건에 맞는 계정 목록 조회 (limit이 None이면 전체 조회)"""
+        ...
     
-    @abstractmethod
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Account]:
         """모든 계정 목록 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_active(self) -> List[Account]:
         """활성 계정 목록 조회"""
-        pass
+        ...
+    
+    def stream_active(self, batch_size: int = 500) -> AsyncIterator[Account]:
+        """활성 계정을 batch_size 단위로 읽어 순차적으로 반환 (전체 목록 미적재)"""
+        ...
     
-    @abstractmethod
     async def update(self, account: Account) -> Account:
         """계정 정보 업데이트"""
-        pass
+        ...
+    
+    async def update_status(
+        self, account_id: UUID, status: AccountStatus
+    ) -> Optional[Account]:
+        """계정 상태를 단일 UPDATE ... RETURNING 쿼리로 변경"""
+        ...
+    
+    async def update_last_sync_at(self, account_id: UUID, last_sync_at: datetime) -> bool:
+        """계정의 마지막 동기화 시간만 변경 (다른 컬럼은 건드리지 않음, 계정이 없으면 False)"""
+        ...
     
-    @abstractmethod
     async def delete(self, account_id: UUID) -> bool:
         """계정 삭제"""
-        pass
+        ...
     
-    @abstractmethod
     async def exists_by_email(self, email: str) -> bool:
         """이메일로 계정 존재 여부 확인"""
-        pass
+        ...
 
 
-class AuthConfigRepositoryPort(ABC):
+class AuthConfigRepositoryPort(Protocol):
     """인증 설정 저장소 포트"""
     
-    @abstractmethod
     async def create_auth_code_config(self, config: AuthCodeConfig) -> AuthCodeConfig:
         """Authorization Code 설정 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def create_device_code_config(self, config: DeviceCodeConfig) -> DeviceCodeConfig:
         """Device Code 설정 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_auth_code_config(self, account_id: UUID) -> Optional[AuthCodeConfig]:
         """Authorization Code 설정 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_device_code_config(self, account_id: UUID) -> Optional[DeviceCodeConfig]:
         """Device Code 설정 조회"""
-        pass
+        ...
+    
+    async def get_config_for_account(
+        self, account_id: UUID
+    ) -> Optional[AuthCodeConfig | DeviceCodeConfig]:
+        """계정의 인증 타입에 맞는 인증 설정을 단일 쿼리로 조회"""
+        ...
+    
+    async def get_configs_for_accounts(
+        self, account_ids: List[UUID]
+    ) -> Dict[UUID, AuthCodeConfig | DeviceCodeConfig]:
+        """여러 계정의 인증 설정을 단일 쿼리로 일괄 조회"""
+        ...
+    
+    async def get_account_with_config(
+        self, account_id: UUID
+    ) -> Tuple[Optional[Account], Optional[AuthCodeConfig | DeviceCodeConfig]]:
+        """계정과 인증 타입에 맞는 설정을 단일 쿼리로 함께 조회"""
+        ...
     
-    @abstractmethod
     async def update_auth_code_config(self, config: AuthCodeConfig) -> AuthCodeConfig:
         """Authorization Code 설정 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete_config(self, account_id: UUID) -> bool:
         """인증 설정 삭제"""
-        pass
+        ...
 
 
-class TokenRepositoryPort(ABC):
+class TokenRepositoryPort(Protocol):
     """토큰 저장소 포트"""
     
-    @abstractmethod
     async def save(self, token: Token) -> Token:
         """토큰 저장"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_account_id(self, account_id: UUID) -> Optional[Token]:
         """계정 ID로 토큰 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, token: Token) -> Token:
         """토큰 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, account_id: UUID) -> bool:
         """토큰 삭제"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_expired_tokens(self) -> List[Token]:
         """만료된 토큰 목록 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_near_expiry_tokens(self, minutes: int = 5) -> List[Token]:
         """곧 만료될 토큰 목록 조회"""
-        pass
+        ...
 
 
-class MailRepositoryPort(ABC):
+class MailRepositoryPort(Protocol):
     """메일 저장소 포트"""
     
-    @abstractmethod
     async def create(self, mail: Mail) -> Mail:
         """메일 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_id(self, mail_id: UUID) -> Optional[Mail]:
         """ID로 메일 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_message_id(self, account_id: UUID, message_id: str) -> Optional[Mail]:
         """메시지 ID로 메일 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_by_account(
         self,
         account_id: UUID,
@@ -162,43 +198,61 @@ class MailRepositoryPort(ABC):
         end_date: Optional[datetime] = None,
     ) -> List[Mail]:
         """계정별 메일 목록 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_unprocessed(self, account_id: UUID) -> List[Mail]:
         """미처리 메일 목록 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, mail: Mail) -> Mail:
         """메일 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, mail_id: UUID) -> bool:
         """메일 삭제"""
-        pass
+        ...
     
-    @abstractmethod
     async def exists_by_message_id(self, account_id: UUID, message_id: str) -> bool:
         """메시지 ID로 메일 존재 여부 확인"""
-        pass
+        ...
+    
+    async def exists_many(self, account_id: UUID, message_ids: List[str]) -> Set[str]:
+        """
+        메시지 ID 목록 중 해당 계정에 이미 저장된 메시지 ID 집합을 단일 쿼리로 조회
+        
+        빈 목록이면 쿼리 없이 빈 집합을 반환합니다. 저장되지 않은 ID는 결과에 포함되지 않습니다.
+        """
+        ...
+    
+    async def create_many(self, mails: List[Mail]) -> List[Mail]:
+        """
+        여러 메일을 단일 트랜잭션으로 생성 (저장된 메일을 같은 순서로 반환)
+        
+        전부 저장되거나 하나도 저장되지 않습니다. (계정 ID, 메시지 ID)가 이미 저장된 메일이
+        하나라도 있으면 전체를 롤백하고 예외를 발생시킵니다. 빈 목록이면 빈 목록을 반환합니다.
+        """
+        ...
+    
+    async def mark_processed_many(self, mail_ids: List[UUID]) -> int:
+        """
+        여러 메일을 단일 UPDATE로 처리 완료 표시 (변경된 행 수 반환)
+        
+        빈 목록이면 0을 반환하며, 존재하지 않는 ID는 무시합니다.
+        """
+        ...
 
 
-class SyncHistoryRepositoryPort(ABC):
+class SyncHistoryRepositoryPort(Protocol):
     """동기화 이력 저장소 포트"""
     
-    @abstractmethod
     async def create(self, sync_history: SyncHistory) -> SyncHistory:
         """동기화 이력 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_id(self, sync_id: UUID) -> Optional[SyncHistory]:
         """ID로 동기화 이력 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_by_account(
         self,
         account_id: UUID,
@@ -206,91 +260,115 @@ class SyncHistoryRepositoryPort(ABC):
         limit: int = 100,
     ) -> List[SyncHistory]:
         """계정별 동기화 이력 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_latest_by_account(self, account_id: UUID) -> Optional[SyncHistory]:
         """계정의 최신 동기화 이력 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, sync_history: SyncHistory) -> SyncHistory:
         """동기화 이력 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, sync_id: UUID) -> bool:
         """동기화 이력 삭제"""
-        pass
+        ...
 
 
-class DeltaLinkRepositoryPort(ABC):
+class DeltaLinkRepositoryPort(Protocol):
     """델타 링크 저장소 포트"""
     
-    @abstractmethod
     async def save(self, delta_link: DeltaLink) -> DeltaLink:
         """델타 링크 저장"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_account_id(self, account_id: UUID) -> Optional[DeltaLink]:
         """계정 ID로 델타 링크 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, delta_link: DeltaLink) -> DeltaLink:
         """델타 링크 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, account_id: UUID) -> bool:
         """델타 링크 삭제"""
-        pass
+        ...
 
 
-class WebhookSubscriptionRepositoryPort(ABC):
+class WebhookSubscriptionRepositoryPort(Protocol):
     """웹훅 구독 저장소 포트"""
     
-    @abstractmethod
     async def create(self, subscription: WebhookSubscription) -> WebhookSubscription:
         """웹훅 구독 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_id(self, subscription_id: UUID) -> Optional[WebhookSubscription]:
         """ID로 웹훅 구독 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_account_id(self, account_id: UUID) -> Optional[WebhookSubscription]:
         """계정 ID로 웹훅 구독 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_expired(self) -> List[WebhookSubscription]:
         """만료된 웹훅 구독 목록 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_near_expiry(self, hours: int = 24) -> List[WebhookSubscription]:
         """곧 만료될 웹훅 구독 목록 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, subscription: WebhookSubscription) -> WebhookSubscription:
         """웹훅 구독 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, subscription_id: UUID) -> bool:
         """웹훅 구독 삭제"""
-        pass
+        ...
+
+
+class DeviceCodePollError(Exception):
+    """
+    Device Code 폴링 시 토큰 엔드포인트가 반환한 OAuth 오류
+    
+    오류 코드별 하위 클래스로 발생하며, retry_after 는 서버가 Retry-After 로
+    알려준 재시도 대기 시간(초)입니다.
+    """
+    
+    error_code = "unknown_error"
+    
+    def __init__(self, retry_after: Optional[int] = None):
+        super().__init__(self.error_code)
+        self.retry_after = retry_after
+
+
+class AuthorizationPendingError(DeviceCodePollError):
+    """사용자가 아직 인증을 완료하지 않음"""
+    
+    error_code = "authorization_pending"
+
+
+class SlowDownError(DeviceCodePollError):
+    """폴링 간격을 늘려야 함"""
+    
+    error_code = "slow_down"
+
+
+class AccessDeniedError(DeviceCodePollError):
+    """사용자가 인증을 거부함"""
+    
+    error_code = "access_denied"
+
 
+class ExpiredTokenError(DeviceCodePollError):
+    """디바이스 코드가 만료됨"""
+    
+    error_code = "expired_token"
 
-class GraphApiClientPort(ABC):
+
+class GraphApiClientPort(Protocol):
     """Microsoft Graph API 클라이언트 포트"""
     
-    @abstractmethod
     async def get_authorization_url(
         self,
         client_id: str,
@@ -300,9 +378,8 @@ class GraphApiClientPort(ABC):
         state: str,
     ) -> str:
         """인증 URL 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_device_code(
         self,
         client_id: str,
@@ -310,9 +387,8 @@ class GraphApiClientPort(ABC):
         scope: str,
     ) -> dict:
         """디바이스 코드 요청"""
-        pass
+        ...
     
-    @abstractmethod
     async def exchange_code_for_token(
         self,
         client_id: str,
@@ -322,19 +398,17 @@ class GraphApiClientPort(ABC):
         code: str,
     ) -> dict:
         """인증 코드를 토큰으로 교환"""
-        pass
+        ...
     
-    @abstractmethod
     async def poll_device_code(
         self,
         client_id: str,
         tenant_id: str,
         device_code: str,
     ) -> dict:
-        """디바이스 코드 폴링"""
-        pass
+        """디바이스 코드 폴링 (대기/거부/만료 등은 DeviceCodePollError 발생)"""
+        ...
     
-    @abstractmethod
     async def refresh_token(
         self,
         client_id: str,
@@ -343,14 +417,12 @@ class GraphApiClientPort(ABC):
         refresh_token: str,
     ) -> dict:
         """토큰 갱신"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_user_profile(self, access_token: str) -> dict:
         """사용자 프로필 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def list_messages(
         self,
         access_token: str,
@@ -358,26 +430,42 @@ class GraphApiClientPort(ABC):
         skip: int = 0,
         filter_query: Optional[str] = None,
         order_by: Optional[str] = None,
+        select: Optional[List[str]] = None,
     ) -> dict:
-        """메시지 목록 조회"""
-        pass
+        """메시지 목록 조회 (select: 조회할 필드 목록, $select)"""
+        ...
     
-    @abstractmethod
-    async def get_message(self, access_token: str, message_id: str) -> dict:
-        """특정 메시지 조회"""
-        pass
+    async def batch_list_messages(
+        self,
+        access_token: str,
+        pages: List[Tuple[int, int]],
+        order_by: Optional[str] = None,
+        select: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """여러 페이지의 메시지 목록을 JSON $batch 한 번으로 조회 (pages: (top, skip) 목록, 요청 순서대로 반환)"""
+        ...
+    
+    async def get_message(
+        self,
+        access_token: str,
+        message_id: str,
+        select: Optional[List[str]] = None,
+    ) -> dict:
+        """특정 메시지 조회 (select: 조회할 필드 목록, $select)"""
+        ...
     
-    @abstractmethod
     async def send_message(self, access_token: str, message_data: dict) -> dict:
         """메시지 발송"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_delta_messages(self, access_token: str, delta_link: str) -> dict:
         """델타 메시지 조회"""
-        pass
+        ...
+    
+    async def get_next_page(self, access_token: str, url: str) -> dict:
+        """@odata.nextLink로 다음 페이지 조회"""
+        ...
     
-    @abstractmethod
     async def create_subscription(
         self,
         access_token: str,
@@ -388,9 +476,8 @@ class GraphApiClientPort(ABC):
         client_state: Optional[str] = None,
     ) -> dict:
         """웹훅 구독 생성"""
-        pass
+        ...
     
-    @abstractmethod
     async def update_subscription(
         self,
         access_token: str,
@@ -398,250 +485,232 @@ class GraphApiClientPort(ABC):
         expiration_datetime: str,
     ) -> dict:
         """웹훅 구독 업데이트"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete_subscription(
         self,
         access_token: str,
         subscription_id: str,
     ) -> bool:
         """웹훅 구독 삭제"""
-        pass
+        ...
 
 
-class EncryptionServicePort(ABC):
+class EncryptionServicePort(Protocol):
     """암호화 서비스 포트"""
     
-    @abstractmethod
     async def encrypt(self, data: str) -> str:
         """데이터 암호화"""
-        pass
+        ...
     
-    @abstractmethod
     async def decrypt(self, encrypted_data: str) -> str:
         """데이터 복호화"""
-        pass
+        ...
+    
+    async def decrypt_many(self, encrypted_values: List[str]) -> List[str]:
+        """여러 데이터를 한 번에 복호화 (입력 순서대로 반환)"""
+        ...
 
 
-class ExternalApiClientPort(ABC):
+class ExternalApiClientPort(Protocol):
     """외부 API 클라이언트 포트"""
     
-    @abstractmethod
     async def send_mail_data(self, mail_data: dict) -> bool:
         """메일 데이터를 외부 API로 전송"""
-        pass
+        ...
+    
+    async def send_mail_data_bulk(self, items: List[dict]) -> List[bool]:
+        """여러 메일 데이터를 한 번에 외부 API로 전송 (항목별 성공 여부를 같은 순서로 반환)"""
+        ...
     
-    @abstractmethod
     async def send_notification(self, notification_data: dict) -> bool:
         """알림을 외부 API로 전송"""
-        pass
+        ...
 
 
-class CacheServicePort(ABC):
+class CacheServicePort(Protocol):
     """캐시 서비스 포트"""
     
-    @abstractmethod
     async def get(self, key: str) -> Optional[str]:
         """캐시에서 값 조회"""
-        pass
+        ...
     
-    @abstractmethod
     async def set(self, key: str, value: str, expire: Optional[int] = None) -> bool:
         """캐시에 값 저장"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
-        pass
+        ...
     
-    @abstractmethod
     async def exists(self, key: str) -> bool:
         """캐시에 키 존재 여부 확인"""
-        pass
+        ...
 
 
-class LoggerPort(ABC):
-    """로거 포트"""
+class LoggerPort(Protocol):
+    """로거 포트
+    
+    메시지는 %-포맷 문자열이며, args는 해당 레벨이 활성화된 경우에만 포맷됩니다.
+    warning/error에 exc_info=True를 넘기면 처리 중인 예외의 traceback을 함께 기록합니다.
+    """
     
-    @abstractmethod
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """정보 로그"""
-        pass
+        ...
     
-    @abstractmethod
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """경고 로그"""
-        pass
+        ...
     
-    @abstractmethod
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """오류 로그"""
-        pass
+        ...
     
-    @abstractmethod
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """디버그 로그"""
-        pass
+        ...
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨(logging.DEBUG 등) 로그 출력 여부"""
+        ...
 
 
-class ConfigPort(ABC):
+class ConfigPort(Protocol):
     """설정 포트"""
     
     # 환경 설정
-    @abstractmethod
     def get_environment(self) -> str:
         """환경 조회 (development, production, testing)"""
-        pass
+        ...
     
-    @abstractmethod
     def is_debug(self) -> bool:
         """디버그 모드 여부"""
-        pass
+        ...
     
     # 데이터베이스 설정
-    @abstractmethod
     def get_database_url(self) -> str:
         """데이터베이스 URL 조회"""
-        pass
+        ...
     
     # 캐시 설정 (Redis 제거, 데이터베이스 기반으로 변경)
-    @abstractmethod
     def get_cache_ttl(self) -> int:
         """캐시 기본 TTL (초) 조회"""
-        pass
+        ...
     
     # Microsoft Azure 설정
-    @abstractmethod
     def get_azure_client_id(self) -> str:
         """Azure 클라이언트 ID 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_azure_client_secret(self) -> str:
         """Azure 클라이언트 시크릿 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_azure_tenant_id(self) -> str:
         """Azure 테넌트 ID 조회"""
-        pass
+        ...
     
     # OAuth 설정
-    @abstractmethod
     def get_oauth_redirect_uri(self) -> str:
         """OAuth 리다이렉트 URI 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_oauth_state_secret(self) -> str:
         """OAuth State 시크릿 키 조회"""
-        pass
+        ...
     
     # 보안 설정
-    @abstractmethod
     def get_encryption_key(self) -> str:
         """암호화 키 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_jwt_secret_key(self) -> str:
         """JWT 시크릿 키 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_jwt_algorithm(self) -> str:
         """JWT 알고리즘 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_jwt_expire_minutes(self) -> int:
         """JWT 만료 시간(분) 조회"""
-        pass
+        ...
     
     # 웹훅 설정
-    @abstractmethod
     def get_webhook_secret(self) -> str:
         """웹훅 시크릿 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_webhook_base_url(self) -> str:
         """웹훅 베이스 URL 조회"""
-        pass
+        ...
     
     # 로깅 설정
-    @abstractmethod
     def get_log_level(self) -> str:
         """로그 레벨 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_log_format(self) -> str:
         """로그 포맷 조회"""
-        pass
+        ...
     
     # 웹 서버 설정
-    @abstractmethod
     def get_web_host(self) -> str:
         """웹 서버 호스트 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_web_port(self) -> int:
         """웹 서버 포트 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_web_workers(self) -> int:
         """웹 서버 워커 수 조회"""
-        pass
+        ...
+    
+    def get_web_threadpool_tokens(self) -> int:
+        """웹 서버 스레드풀 동시 실행 한도 조회"""
+        ...
+    
+    def get_web_cors_origins(self) -> List[str]:
+        """웹 서버 CORS 허용 오리진 목록 조회"""
+        ...
     
     # API 서버 설정 (향후 REST API용)
-    @abstractmethod
     def get_api_host(self) -> str:
         """API 서버 호스트 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_api_port(self) -> int:
         """API 서버 포트 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_api_workers(self) -> int:
         """API 서버 워커 수 조회"""
-        pass
+        ...
     
     # 동기화 설정
-    @abstractmethod
     def get_sync_batch_size(self) -> int:
         """동기화 배치 크기 조회"""
-        pass
+        ...
     
-    @abstractmethod
     def get_sync_interval_minutes(self) -> int:
         """동기화 간격(분) 조회"""
-        pass
+        ...
     
     # 복합 설정 조회 메서드
-    @abstractmethod
-    def get_azure_config(self) -> dict:
+    def get_azure_config(self) -> Mapping[str, Any]:
         """Azure 설정 조회"""
-        pass
+        ...
     
-    @abstractmethod
-    def get_web_config(self) -> dict:
+    def get_web_config(self) -> Mapping[str, Any]:
         """웹 서버 설정 조회"""
-        pass
+        ...
     
-    @abstractmethod
-    def get_api_config(self) -> dict:
+    def get_api_config(self) -> Mapping[str, Any]:
         """API 서버 설정 조회"""
-        pass
+        ...
     
-    @abstractmethod
-    def get_log_config(self) -> dict:
+    def get_log_config(self) -> Mapping[str, Any]:
         """로그 설정 조회"""
-        pass
+        ...
@@ -4,7 +4,8 @@
 Microsoft 365 계정의 등록, 조회, 수정, 삭제 등의 비즈니스 로직을 구현합니다.
 """
 
-from typing import List, Optional
+import logging
+from typing import AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
 from ..domain.entities import (
@@ -15,6 +16,7 @@ from ..domain.entities import (
     DeviceCodeConfig,
 )
 from ..domain.ports import (
+    AccountFilter,
     AccountRepositoryPort,
     AuthConfigRepositoryPort,
     TokenRepositoryPort,
@@ -22,6 +24,58 @@ from ..domain.ports import (
 )
 
 
+# 인증 방식별 필수 등록 정보
+_REQUIRED_FIELDS = {
+    AuthType.AUTHORIZATION_CODE: ("client_id", "client_secret", "redirect_uri", "tenant_id"),
+    AuthType.DEVICE_CODE: ("client_id", "tenant_id"),
+}
+
+_FLOW_NAMES = {
+    AuthType.AUTHORIZATION_CODE: "Authorization Code Flow",
+    AuthType.DEVICE_CODE: "Device Code Flow",
+}
+
+
+def _build_auth_code_config(
+    account_id: UUID,
+    client_id: str,
+    client_secret: str,
+    redirect_uri: str,
+    tenant_id: str,
+) -> AuthCodeConfig:
+    """Authorization Code Flow 설정을 생성합니다."""
+    return AuthCodeConfig(
+        account_id=account_id,
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uri=redirect_uri,
+        tenant_id=tenant_id,
+    )
+
+
+def _build_device_code_config(
+    account_id: UUID,
+    client_id: str,
+    client_secret: Optional[str],
+    redirect_uri: Optional[str],
+    tenant_id: str,
+) -> DeviceCodeConfig:
+    """Device Code Flow 설정을 생성합니다. (redirect_uri 미사용)"""
+    return DeviceCodeConfig(
+        account_id=account_id,
+        client_id=client_id,
+        tenant_id=tenant_id,
+        client_secret=client_secret,  # client_secret 전달 추가
+    )
+
+
+# 인증 방식별 설정 생성 함수
+_CONFIG_BUILDERS = {
+    AuthType.AUTHORIZATION_CODE: _build_auth_code_config,
+    AuthType.DEVICE_CODE: _build_device_code_config,
+}
+
+
 class AccountManagementUseCase:
     """계정 관리 유즈케이스"""
     
@@ -29,10 +83,12 @@ class AccountManagementUseCase:
         self,
         account_repository: AccountRepositoryPort,
         auth_config_repository: AuthConfigRepositoryPort,
+        token_repository: TokenRepositoryPort,
         logger: LoggerPort,
     ):
         self.account_repository = account_repository
         self.auth_config_repository = auth_config_repository
+        self.token_repository = token_repository
         self.logger = logger
     
     async def register_account(
@@ -63,20 +119,18 @@ class AccountManagementUseCase:
         Raises:
             ValueError: 중복 계정이거나 필수 정보가 누락된 경우
         """
-        self.logger.info(f"계정 등록 시작: {email}, 인증방식: {auth_type}")
-        
-        # 중복 계정 확인
-        if await self.account_repository.exists_by_email(email):
-            self.logger.warning(f"중복 계정 등록 시도: {email}")
-            raise ValueError(f"이미 등록된 계정입니다: {email}")
+        self.logger.info("계정 등록 시작: %s, 인증방식: %s", email, auth_type)
         
         # 인증 방식별 필수 정보 검증
-        if auth_type == AuthType.AUTHORIZATION_CODE:
-            if not all([client_id, client_secret, redirect_uri, tenant_id]):
-                raise ValueError("Authorization Code Flow에는 client_id, client_secret, redirect_uri, tenant_id가 필요합니다")
-        elif auth_type == AuthType.DEVICE_CODE:
-            if not all([client_id, tenant_id]):
-                raise ValueError("Device Code Flow에는 client_id, tenant_id가 필요합니다")
+        provided = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "redirect_uri": redirect_uri,
+            "tenant_id": tenant_id,
+        }
+        missing = [name for name in _REQUIRED_FIELDS[auth_type] if not provided[name]]
+        if missing:
+            raise ValueError(f"{_FLOW_NAMES[auth_type]}에는 {', '.join(missing)}가 필요합니다")
         
         # 계정 생성
         account = Account(
@@ -86,31 +140,24 @@ class AccountManagementUseCase:
             tenant_id=tenant_id,
         )
         
-        # 계정 저장
-        created_account = await self.account_repository.create(account)
-        
-        # 인증 설정 저장
-        if auth_type == AuthType.AUTHORIZATION_CODE:
-            auth_config = AuthCodeConfig(
-                account_id=created_account.id,
-                client_id=client_id,
-                client_secret=client_secret,
-                redirect_uri=redirect_uri,
-                tenant_id=tenant_id,
-            )
-            await self.auth_config_repository.create_auth_code_config(auth_config)
-        elif auth_type == AuthType.DEVICE_CODE:
-            self.logger.info(f"Device Code 설정 생성 - client_secret 전달 여부: {client_secret is not None}")
-            auth_config = DeviceCodeConfig(
-                account_id=created_account.id,
-                client_id=client_id,
-                tenant_id=tenant_id,
-                client_secret=client_secret,  # client_secret 전달 추가
+        # 인증 설정 구성 (계정 ID는 엔티티 생성 시 할당됨)
+        auth_config = _CONFIG_BUILDERS[auth_type](account.id, **provided)
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info(
+                "%s 설정 생성 완료 - client_secret: %s",
+                _FLOW_NAMES[auth_type],
+                '설정됨' if auth_config.client_secret else '미설정',
             )
-            self.logger.info(f"Device Code 설정 생성 완료 - client_secret: {'설정됨' if auth_config.client_secret else '미설정'}")
-            await self.auth_config_repository.create_device_code_config(auth_config)
         
-        self.logger.info(f"계정 등록 완료: {created_account.id}, {email}")
+        # 계정과 인증 설정을 하나의 트랜잭션으로 저장
+        # 중복 계정은 사전 조회 없이 이메일 UNIQUE 제약으로 판별
+        try:
+            created_account = await self.account_repository.create_with_config(account, auth_config)
+        except ValueError:
+            self.logger.warning("중복 계정 등록 시도: %s", email)
+            raise
+        
+        self.logger.info("계정 등록 완료: %s, %s", created_account.id, email)
         return created_account
     
     async def get_account_by_id(self, account_id: UUID) -> Optional[Account]:
@@ -123,7 +170,7 @@ class AccountManagementUseCase:
         Returns:
             계정 엔티티 또는 None
         """
-        self.logger.debug(f"계정 조회: {account_id}")
+        self.logger.debug("계정 조회: %s", account_id)
         return await self.account_repository.get_by_id(account_id)
     
     async def get_account_by_email(self, email: str) -> Optional[Account]:
@@ -136,7 +183,7 @@ class AccountManagementUseCase:
         Returns:
             계정 엔티티 또는 None
         """
-        self.logger.debug(f"계정 조회 (이메일): {email}")
+        self.logger.debug("계정 조회 (이메일): %s", email)
         return await self.account_repository.get_by_email(email)
     
     async def list_accounts(self, skip: int = 0, limit: int = 100) -> List[Account]:
@@ -150,8 +197,8 @@ class AccountManagementUseCase:
         Returns:
             계정 목록
         """
-        self.logger.debug(f"계정 목록 조회: skip={skip}, limit={limit}")
-        return await self.account_repository.list_all(skip=skip, limit=limit)
+        self.logger.debug("계정 목록 조회: skip=%s, limit=%s", skip, limit)
+        return await self.account_repository.list(AccountFilter(), skip=skip, limit=limit)
     
     async def list_active_accounts(self) -> List[Account]:
         """
@@ -161,7 +208,22 @@ class AccountManagementUseCase:
             활성 계정 목록
         """
         self.logger.debug("활성 계정 목록 조회")
-        return await self.account_repository.list_active()
+        return await self.account_repository.list(AccountFilter(active_only=True), limit=None)
+    
+    def stream_active_accounts(self, batch_size: int = 500) -> AsyncIterator[Account]:
+        """
+        활성 계정을 스트리밍으로 조회합니다.
+        
+        전체 목록을 메모리에 올리지 않고 batch_size 단위로 읽어 순차 처리할 때 사용합니다.
+        
+        Args:
+            batch_size: 한 번에 읽어올 행 수
+        
+        Returns:
+            활성 계정 비동기 이터레이터
+        """
+        self.logger.debug("활성 계정 스트리밍 조회: batch_size=%s", batch_size)
+        return self.account_repository.stream_active(batch_size)
     
     async def update_account(
         self,
@@ -182,11 +244,11 @@ class AccountManagementUseCase:
         Returns:
             업데이트된 계정 엔티티 또는 None
         """
-        self.logger.info(f"계정 정보 업데이트: {account_id}")
+        self.logger.info("계정 정보 업데이트: %s", account_id)
         
         account = await self.account_repository.get_by_id(account_id)
         if not account:
-            self.logger.warning(f"존재하지 않는 계정 업데이트 시도: {account_id}")
+            self.logger.warning("존재하지 않는 계정 업데이트 시도: %s", account_id)
             return None
         
         # 인증 타입 변경 여부 확인
@@ -203,7 +265,7 @@ class AccountManagementUseCase:
             updated = True
         
         if auth_type_changed:
-            self.logger.info(f"인증 타입 변경: {account.auth_type} -> {auth_type}")
+            self.logger.info("인증 타입 변경: %s -> %s", account.auth_type, auth_type)
             
             # 인증 타입 변경 시 추가 작업 수행
             await self._handle_auth_type_change(account_id, account.auth_type, auth_type)
@@ -216,9 +278,9 @@ class AccountManagementUseCase:
         
         if updated:
             account = await self.account_repository.update(account)
-            self.logger.info(f"계정 정보 업데이트 완료: {account_id}")
+            self.logger.info("계정 정보 업데이트 완료: %s", account_id)
         else:
-            self.logger.debug(f"업데이트할 내용이 없음: {account_id}")
+            self.logger.debug("업데이트할 내용이 없음: %s", account_id)
         
         return account
     
@@ -236,23 +298,23 @@ class AccountManagementUseCase:
             old_auth_type: 기존 인증 타입
             new_auth_type: 새로운 인증 타입
         """
-        self.logger.info(f"인증 타입 변경 정리 작업 시작: {account_id}")
+        self.logger.info("인증 타입 변경 정리 작업 시작: %s", account_id)
         
-        # 1. 기존 토큰 삭제 (TokenRepositoryPort가 필요하지만 현재 의존성에 없음)
-        # TODO: TokenRepositoryPort 의존성 추가 후 토큰 삭제 로직 구현
-        self.logger.warning(f"토큰 삭제 로직 미구현 - 수동으로 삭제 필요: {account_id}")
-        
-        # 2. 기존 인증 설정 삭제
+        # 1. 기존 토큰 및 인증 설정 삭제
+        # 두 저장소는 같은 세션을 공유하므로 순서대로 실행하고, 세션 I/O 도중 취소되지 않도록 제한 시간을 두지 않음
+        # 삭제에 실패하면 세션 상태를 알 수 없으므로 계정 업데이트를 진행하지 않고 오류를 그대로 전달
         try:
+            await self.token_repository.delete(account_id)
             await self.auth_config_repository.delete_config(account_id)
-            self.logger.info(f"기존 인증 설정 삭제 완료: {account_id}")
         except Exception as e:
-            self.logger.error(f"기존 인증 설정 삭제 실패: {account_id}, 오류: {str(e)}")
+            self.logger.error("기존 토큰 및 인증 설정 삭제 실패: %s, 오류: %s", account_id, str(e))
+            raise
+        self.logger.info("기존 토큰 및 인증 설정 삭제 완료: %s", account_id)
         
-        # 3. 새로운 인증 설정은 별도로 생성해야 함 (client_id, client_secret 등이 필요)
-        self.logger.info(f"새로운 인증 설정은 별도 등록 필요: {new_auth_type}")
+        # 2. 새로운 인증 설정은 별도로 생성해야 함 (client_id, client_secret 등이 필요)
+        self.logger.info("새로운 인증 설정은 별도 등록 필요: %s", new_auth_type)
         
-        self.logger.info(f"인증 타입 변경 정리 작업 완료: {account_id}")
+        self.logger.info("인증 타입 변경 정리 작업 완료: %s", account_id)
     
     async def list_accounts_by_status(
         self, 
@@ -271,8 +333,10 @@ class AccountManagementUseCase:
         Returns:
             계정 목록
         """
-        self.logger.debug(f"상태별 계정 목록 조회: status={status}, skip={skip}, limit={limit}")
-        return await self.account_repository.list_by_status(status, skip=skip, limit=limit)
+        self.logger.debug("상태별 계정 목록 조회: status=%s, skip=%s, limit=%s", status, skip, limit)
+        return await self.account_repository.list(
+            AccountFilter(status=status), skip=skip, limit=limit
+        )
     
     async def list_accounts_by_auth_type(
         self, 
@@ -291,8 +355,10 @@ class AccountManagementUseCase:
         Returns:
             계정 목록
         """
-        self.logger.debug(f"인증 타입별 계정 목록 조회: auth_type={auth_type}, skip={skip}, limit={limit}")
-        return await self.account_repository.list_by_auth_type(auth_type, skip=skip, limit=limit)
+        self.logger.debug("인증 타입별 계정 목록 조회: auth_type=%s, skip=%s, limit=%s", auth_type, skip, limit)
+        return await self.account_repository.list(
+            AccountFilter(auth_type=auth_type), skip=skip, limit=limit
+        )
     
     async def activate_account(self, account_id: UUID) -> Optional[Account]:
         """
@@ -304,17 +370,16 @@ class AccountManagementUseCase:
         Returns:
             활성화된 계정 엔티티 또는 None
         """
-        self.logger.info(f"계정 활성화: {account_id}")
+        self.logger.info("계정 활성화: %s", account_id)
         
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            self.logger.warning(f"존재하지 않는 계정 활성화 시도: {account_id}")
+        updated_account = await self.account_repository.update_status(
+            account_id, AccountStatus.ACTIVE
+        )
+        if not updated_account:
+            self.logger.warning("존재하지 않는 계정 활성화 시도: %s", account_id)
             return None
         
-        account.activate()
-        updated_account = await self.account_repository.update(account)
-        
-        self.logger.info(f"계정 활성화 완료: {account_id}")
+        self.logger.info("계정 활성화 완료: %s", account_id)
         return updated_account
     
     async def deactivate_account(self, account_id: UUID) -> Optional[Account]:
@@ -327,17 +392,16 @@ class AccountManagementUseCase:
         Returns:
             비활성화된 계정 엔티티 또는 None
         """
-        self.logger.info(f"계정 비활성화: {account_id}")
+        self.logger.info("계정 비활성화: %s", account_id)
         
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            self.logger.warning(f"존재하지 않는 계정 비활성화 시도: {account_id}")
+        updated_account = await self.account_repository.update_status(
+            account_id, AccountStatus.INACTIVE
+        )
+        if not updated_account:
+            self.logger.warning("존재하지 않는 계정 비활성화 시도: %s", account_id)
             return None
         
-        account.deactivate()
-        updated_account = await self.account_repository.update(account)
-        
-        self.logger.info(f"계정 비활성화 완료: {account_id}")
+        self.logger.info("계정 비활성화 완료: %s", account_id)
         return updated_account
     
     async def mark_account_error(self, account_id: UUID) -> Optional[Account]:
@@ -350,17 +414,16 @@ class AccountManagementUseCase:
         Returns:
             오류 상태로 표시된 계정 엔티티 또는 None
         """
-        self.logger.warning(f"계정 오류 상태 표시: {account_id}")
+        self.logger.warning("계정 오류 상태 표시: %s", account_id)
         
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            self.logger.warning(f"존재하지 않는 계정 오류 표시 시도: {account_id}")
+        updated_account = await self.account_repository.update_status(
+            account_id, AccountStatus.ERROR
+        )
+        if not updated_account:
+            self.logger.warning("존재하지 않는 계정 오류 표시 시도: %s", account_id)
             return None
         
-        account.mark_error()
-        updated_account = await self.account_repository.update(account)
-        
-        self.logger.warning(f"계정 오류 상태 표시 완료: {account_id}")
+        self.logger.warning("계정 오류 상태 표시 완료: %s", account_id)
         return updated_account
     
     async def delete_account(self, account_id: UUID) -> bool:
@@ -373,24 +436,18 @@ class AccountManagementUseCase:
         Returns:
             삭제 성공 여부
         """
-        self.logger.info(f"계정 삭제: {account_id}")
+        self.logger.info("계정 삭제: %s", account_id)
         
-        # 계정 존재 확인
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            self.logger.warning(f"존재하지 않는 계정 삭제 시도: {account_id}")
-            return False
-        
-        # 인증 설정 삭제
+        # 인증 설정 삭제 (FK 참조 해제)
         await self.auth_config_repository.delete_config(account_id)
         
-        # 계정 삭제
+        # 계정 삭제 (삭제된 행이 없으면 존재하지 않는 계정)
         success = await self.account_repository.delete(account_id)
         
         if success:
-            self.logger.info(f"계정 삭제 완료: {account_id}")
+            self.logger.info("계정 삭제 완료: %s", account_id)
         else:
-            self.logger.error(f"계정 삭제 실패: {account_id}")
+            self.logger.warning("존재하지 않는 계정 삭제 시도: %s", account_id)
         
         return success
     
@@ -404,15 +461,23 @@ class AccountManagementUseCase:
         Returns:
             인증 설정 엔티티 또는 None
         """
-        self.logger.debug(f"인증 설정 조회: {account_id}")
+        self.logger.debug("인증 설정 조회: %s", account_id)
         
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            return None
+        # 계정의 인증 타입 판별과 설정 조회를 단일 쿼리로 처리
+        return await self.auth_config_repository.get_config_for_account(account_id)
+    
+    async def get_auth_configs(
+        self, account_ids: List[UUID]
+    ) -> Dict[UUID, AuthCodeConfig | DeviceCodeConfig]:
+        """
+        여러 계정의 인증 설정을 일괄 조회합니다.
         
-        if account.auth_type == AuthType.AUTHORIZATION_CODE:
-            return await self.auth_config_repository.get_auth_code_config(account_id)
-        elif account.auth_type == AuthType.DEVICE_CODE:
-            return await self.auth_config_repository.get_device_code_config(account_id)
+        Args:
+            account_ids: 계정 ID 목록
         
-        return None
+        Returns:
+            계정 ID를 키로 하는 인증 설정 딕셔너리
+        """
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug("인증 설정 일괄 조회: %d개", len(account_ids))
+        return await self.auth_config_repository.get_configs_for_accounts(account_ids)
@@ -8,31 +8,138 @@ Microsoft 365 OAuth 2.0 인증 처리를 위한 비즈니스 로직을 구현합
 """
 
 import asyncio
+import base64
+import copy
+import hashlib
+import hmac
+import json
+import logging
+import random
+import secrets
+import struct
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 from uuid import UUID
 
 from ..domain.entities import (
     Account,
+    AccountStatus,
     AuthCodeConfig,
     AuthType,
     DeviceCodeConfig,
+    KST,
     Token,
+    now_kst,
+    parse_jwt,
 )
 from ..domain.ports import (
+    AccessDeniedError,
     AccountRepositoryPort,
     AuthConfigRepositoryPort,
+    AuthorizationPendingError,
     CacheServicePort,
     EncryptionServicePort,
+    ExpiredTokenError,
     GraphApiClientPort,
     LoggerPort,
+    SlowDownError,
     TokenRepositoryPort,
 )
 
 
+# 만료 임박 토큰 일괄 갱신 시 동시 갱신 수 상한
+REFRESH_CONCURRENCY = 10
+
+# 복호화된 액세스 토큰 캐시 최대 항목 수 (LRU)
+PLAIN_TOKEN_CACHE_SIZE = 10_000
+
+# 캐시된 액세스 토큰을 만료 전에 미리 버리는 여유 시간 (초)
+PLAIN_TOKEN_EXPIRY_SKEW_SECONDS = 60
+
+# 사용자 프로필 캐시 유지 시간 (초) 과 최대 항목 수
+USER_PROFILE_CACHE_TTL_SECONDS = 300
+USER_PROFILE_CACHE_SIZE = 10_000
+
+# 만료 시간을 앞당기는 지터 비율과 상한 (초) - 같은 시각에 발급된 토큰들의 갱신 시점 분산
+EXPIRY_JITTER_RATIO = 0.1
+MAX_EXPIRY_JITTER_SECONDS = 240
+
+# 토큰 상태/무결성 조회 결과 재사용 시간 (초) 과 최대 항목 수
+TOKEN_STATUS_MEMO_TTL_SECONDS = 5.0
+TOKEN_STATUS_MEMO_SIZE = 4096
+
+# Device Code 폴링 기본 간격 (초, 서버가 interval 을 주지 않을 때)
+DEFAULT_DEVICE_POLL_INTERVAL = 5
+
+# slow_down 응답 시 늘리는 폴링 간격 (RFC 8628 3.5) 과 증가 상한 (초, 서버가 준 더 긴 간격은 유지)
+SLOW_DOWN_INCREMENT = 5
+MAX_DEVICE_POLL_INTERVAL = 60
+
+# 폴링 간격 안전 여유 (클라이언트/서버 시계 차이로 간격보다 일찍 폴링해 slow_down을 받지 않도록 20% 여유)
+DEVICE_POLL_INTERVAL_MARGIN = 1.2
+
+# 캐시 키 생성 함수 (접두사를 한 곳에서 관리)
+_auth_state_key = "auth_state:{}".format
+_device_code_key = "device_code:{}".format
+
+# Authorization Code Flow state 유효 시간 (초) 과 서명 길이 (바이트)
+STATE_TTL_SECONDS = 600
+_STATE_MAC_SIZE = 16
+
+
+async def _coalesce(inflight: Dict, key, run: Callable[[], Awaitable]):
+    """
+    같은 키로 진행 중인 작업이 있으면 새로 실행하지 않고 그 결과를 공유합니다.
+    
+    이벤트 루프는 단일 스레드이므로 조회와 등록 사이에 await가 없으면 별도 락이 필요 없습니다.
+    작업을 실행하던 쪽이 취소되면 대기자는 취소 오류를 받지 않고 작업을 직접 다시 실행합니다.
+    """
+    while (future := inflight.get(key)) is not None:
+        try:
+            # 대기자가 취소되어도 공유 작업은 취소되지 않도록 shield
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 대기자 자신이 취소된 경우에만 취소를 전달 (공유 작업만 취소된 경우 다시 시도)
+            if not future.cancelled() or asyncio.current_task().cancelling():
+                raise
+    
+    future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await run()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # 대기자가 없을 때 'exception was never retrieved' 경고 방지
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        inflight.pop(key, None)
+
+
 class AuthenticationUseCase:
     """인증 유즈케이스"""
     
+    # 진행 중인 토큰 갱신 / Device Code 폴링
+    # 유즈케이스는 세션 단위로 생성되므로 프로세스 전역(클래스 속성)으로 공유
+    _refresh_inflight: Dict[UUID, asyncio.Future] = {}
+    _device_poll_inflight: Dict[str, asyncio.Future] = {}
+    
+    # 계정별 (복호화된 액세스 토큰, 만료 시간, 사용 기한 epoch 초) (프로세스 전역 LRU)
+    _plain_token_cache: "OrderedDict[UUID, Tuple[str, datetime, float]]" = OrderedDict()
+    
+    # 계정별 (조회 시각, Graph 사용자 프로필) (프로세스 전역)
+    _profile_cache: Dict[UUID, Tuple[float, Dict]] = {}
+    
+    # (조회 종류, 계정 ID) 별 (토큰 지문, 저장 시각, 결과) - 상태 조회 결과 단기 재사용 (프로세스 전역)
+    _status_memo: Dict[Tuple[str, UUID], Tuple[tuple, float, Dict]] = {}
+    
     def __init__(
         self,
         account_repository: AccountRepositoryPort,
@@ -42,6 +149,7 @@ class AuthenticationUseCase:
         encryption_service: EncryptionServicePort,
         cache_service: CacheServicePort,
         logger: LoggerPort,
+        state_secret: Optional[str] = None,
     ):
         self.account_repository = account_repository
         self.auth_config_repository = auth_config_repository
@@ -50,6 +158,12 @@ class AuthenticationUseCase:
         self.encryption_service = encryption_service
         self.cache_service = cache_service
         self.logger = logger
+        
+        # state_secret 이 있으면 캐시 대신 HMAC 서명된 state 사용
+        self._state_key = state_secret.encode() if state_secret else None
+        
+        # 저장소들은 하나의 AsyncSession을 공유하므로 동시 갱신 시 DB 접근만 직렬화
+        self._session_lock = asyncio.Lock()
     
     async def start_authorization_code_flow(
         self,
@@ -71,28 +185,28 @@ class AuthenticationUseCase:
         """
         self.logger.info(f"Authorization Code Flow 시작: {account_id}")
         
-        # 계정 조회
-        account = await self.account_repository.get_by_id(account_id)
+        # 계정 및 인증 설정 조회 (단일 쿼리)
+        account, auth_config = await self.auth_config_repository.get_account_with_config(account_id)
         if not account:
             raise ValueError(f"계정을 찾을 수 없습니다: {account_id}")
         
         if account.auth_type != AuthType.AUTHORIZATION_CODE:
             raise ValueError(f"Authorization Code Flow가 아닙니다: {account.auth_type}")
         
-        # 인증 설정 조회
-        auth_config = await self.auth_config_repository.get_auth_code_config(account_id)
         if not auth_config:
             raise ValueError(f"인증 설정을 찾을 수 없습니다: {account_id}")
         
-        # State 생성 및 캐시 저장
-        import secrets
-        state = secrets.token_urlsafe(32)
-        cache_key = f"auth_state:{state}"
-        await self.cache_service.set(
-            cache_key,
-            str(account_id),
-            expire=600  # 10분
-        )
+        # State 생성 (서명 키가 없으면 캐시 저장)
+        if self._state_key:
+            state = self._sign_state(account_id)
+        else:
+            state = secrets.token_urlsafe(32)
+            cache_key = _auth_state_key(state)
+            await self.cache_service.set(
+                cache_key,
+                str(account_id),
+                expire=STATE_TTL_SECONDS  # 10분
+            )
         
         # 인증 URL 생성
         authorization_url = await self.graph_api_client.get_authorization_url(
@@ -129,21 +243,25 @@ class AuthenticationUseCase:
         self.logger.info(f"Authorization Code Flow 완료 시작: state={state}")
         
         # State 검증
-        cache_key = f"auth_state:{state}"
-        cached_account_id = await self.cache_service.get(cache_key)
-        if not cached_account_id:
-            raise ValueError("유효하지 않은 state입니다")
-        
-        account_id = UUID(cached_account_id)
-        
-        # State 캐시 삭제
-        await self.cache_service.delete(cache_key)
+        if self._state_key:
+            account_id = self._verify_state(state)
+            if not account_id:
+                raise ValueError("유효하지 않은 state입니다")
+        else:
+            cache_key = _auth_state_key(state)
+            cached_account_id = await self.cache_service.get(cache_key)
+            if not cached_account_id:
+                raise ValueError("유효하지 않은 state입니다")
+            
+            account_id = UUID(cached_account_id)
+            
+            # State 캐시 삭제
+            await self.cache_service.delete(cache_key)
         
-        # 계정 및 인증 설정 조회
-        account = await self.account_repository.get_by_id(account_id)
-        auth_config = await self.auth_config_repository.get_auth_code_config(account_id)
+        # 계정 및 인증 설정 조회 (단일 쿼리)
+        account, auth_config = await self.auth_config_repository.get_account_with_config(account_id)
         
-        if not account or not auth_config:
+        if not account or not isinstance(auth_config, AuthCodeConfig):
             raise ValueError("계정 또는 인증 설정을 찾을 수 없습니다")
         
         # 토큰 교환
@@ -158,13 +276,40 @@ class AuthenticationUseCase:
         # 토큰 저장
         token = await self._save_token(account_id, token_response, scope)
         
-        # 계정 활성화
-        account.activate()
-        await self.account_repository.update(account)
+        # 계정 활성화 (단일 UPDATE)
+        await self.account_repository.update_status(account_id, AccountStatus.ACTIVE)
         
         self.logger.info(f"Authorization Code Flow 완료: {account_id}")
         return token
     
+    def _sign_state(self, account_id: UUID) -> str:
+        """계정 ID와 발급 시각을 HMAC 서명한 state를 생성합니다."""
+        payload = account_id.bytes + struct.pack(">Q", int(time.time()))
+        mac = hmac.new(self._state_key, payload, hashlib.sha256).digest()[:_STATE_MAC_SIZE]
+        return base64.urlsafe_b64encode(payload + mac).rstrip(b"=").decode()
+    
+    def _verify_state(self, state: str) -> Optional[UUID]:
+        """서명된 state를 검증하고 계정 ID를 반환합니다. 유효하지 않으면 None."""
+        try:
+            raw = base64.urlsafe_b64decode(state + "=" * (-len(state) % 4))
+        except ValueError:
+            return None
+        
+        payload, mac = raw[:-_STATE_MAC_SIZE], raw[-_STATE_MAC_SIZE:]
+        if len(payload) != 24:
+            return None
+        
+        expected = hmac.new(self._state_key, payload, hashlib.sha256).digest()[:_STATE_MAC_SIZE]
+        if not hmac.compare_digest(mac, expected):
+            return None
+        
+        # 발급 후 유효 시간 이내인지 확인
+        (issued_at,) = struct.unpack(">Q", payload[16:])
+        if not 0 <= time.time() - issued_at <= STATE_TTL_SECONDS:
+            return None
+        
+        return UUID(bytes=payload[:16])
+    
     async def start_device_code_flow(
         self,
         account_id: UUID,
@@ -185,16 +330,14 @@ class AuthenticationUseCase:
         """
         self.logger.info(f"Device Code Flow 시작: {account_id}")
         
-        # 계정 조회
-        account = await self.account_repository.get_by_id(account_id)
+        # 계정 및 인증 설정 조회 (단일 쿼리)
+        account, auth_config = await self.auth_config_repository.get_account_with_config(account_id)
         if not account:
             raise ValueError(f"계정을 찾을 수 없습니다: {account_id}")
         
         if account.auth_type != AuthType.DEVICE_CODE:
             raise ValueError(f"Device Code Flow가 아닙니다: {account.auth_type}")
         
-        # 인증 설정 조회
-        auth_config = await self.auth_config_repository.get_device_code_config(account_id)
         if not auth_config:
             raise ValueError(f"인증 설정을 찾을 수 없습니다: {account_id}")
         
@@ -207,13 +350,18 @@ class AuthenticationUseCase:
             scope=scope,
         )
         
-        # 디바이스 코드 정보 캐시 저장
-        cache_key = f"device_code:{device_code_response['device_code']}"
-        await self.cache_service.set(
-            cache_key,
-            str(account_id),
-            expire=device_code_response.get('expires_in', 900)  # 기본 15분
-        )
+        # 폴링에 필요한 정보를 한 번에 캐시 저장 (시크릿 값 자체는 저장하지 않음)
+        cache_key = _device_code_key(device_code_response['device_code'])
+        expire = device_code_response.get('expires_in', 900)  # 기본 15분
+        poll_state = {
+            "aid": str(account_id),
+            "cid": auth_config.client_id,
+            "tid": auth_config.tenant_id,
+            "secret": bool(auth_config.client_secret),
+            "interval": device_code_response.get('interval', DEFAULT_DEVICE_POLL_INTERVAL),
+            "expires_at": int(time.time()) + expire,  # 디바이스 코드 만료 시각 (epoch 초)
+        }
+        await self.cache_service.set(cache_key, json.dumps(poll_state), expire=expire)
         
         self.logger.info(f"Device Code Flow 시작 완료: {account_id}")
         return device_code_response
@@ -223,7 +371,7 @@ class AuthenticationUseCase:
         device_code: str,
         scope: str = "https://graph.microsoft.com/.default offline_access",
         max_attempts: int = 60,
-        interval: int = 5,
+        interval: Optional[int] = None,
     ) -> Token:
         """
         Device Code Flow 인증을 폴링하여 완료합니다.
@@ -232,7 +380,7 @@ class AuthenticationUseCase:
             device_code: 디바이스 코드
             scope: 권한 범위
             max_attempts: 최대 시도 횟수
-            interval: 폴링 간격 (초)
+            interval: 폴링 간격 (초, None 이면 서버가 지정한 간격)
             
         Returns:
             생성된 토큰 엔티티
@@ -241,74 +389,108 @@ class AuthenticationUseCase:
             ValueError: 유효하지 않은 디바이스 코드이거나 인증 실패
             TimeoutError: 인증 시간 초과
         """
+        # 같은 디바이스 코드에 대한 동시 폴링은 하나로 합침
+        return await _coalesce(
+            self._device_poll_inflight,
+            device_code,
+            lambda: self._poll_device_code_flow(device_code, scope, max_attempts, interval),
+        )
+    
+    async def _poll_device_code_flow(
+        self,
+        device_code: str,
+        scope: str,
+        max_attempts: int,
+        interval: Optional[int],
+    ) -> Token:
+        """Device Code Flow 폴링 본문"""
         self.logger.info(f"Device Code Flow 폴링 시작: {device_code}")
         
-        # 캐시에서 계정 ID 조회
-        cache_key = f"device_code:{device_code}"
-        cached_account_id = await self.cache_service.get(cache_key)
-        if not cached_account_id:
+        # 캐시에서 폴링 정보 조회
+        cache_key = _device_code_key(device_code)
+        cached_state = await self.cache_service.get(cache_key)
+        if not cached_state:
             raise ValueError("유효하지 않은 디바이스 코드입니다")
         
-        account_id = UUID(cached_account_id)
+        poll_state = json.loads(cached_state)
+        account_id = UUID(poll_state["aid"])
         
-        # 계정 및 인증 설정 조회
-        account = await self.account_repository.get_by_id(account_id)
-        auth_config = await self.auth_config_repository.get_device_code_config(account_id)
+        # 폴링 간격이 지정되지 않으면 서버가 준 값 사용
+        if interval is None:
+            interval = poll_state.get("interval", DEFAULT_DEVICE_POLL_INTERVAL)
         
-        if not account or not auth_config:
-            raise ValueError("계정 또는 인증 설정을 찾을 수 없습니다")
+        # 클라이언트 시크릿이 있는 경우에만 인증 설정을 DB에서 조회
+        client_secret_value = None
+        if poll_state.get("secret"):
+            auth_config = await self.auth_config_repository.get_device_code_config(account_id)
+            if not auth_config:
+                raise ValueError("계정 또는 인증 설정을 찾을 수 없습니다")
+            client_secret_value = auth_config.client_secret
         
-        self.logger.info(f"Device Code 폴링 설정 확인 - client_secret: {'설정됨' if auth_config.client_secret else '미설정'}")
+        self.logger.info(f"Device Code 폴링 설정 확인 - client_secret: {'설정됨' if client_secret_value else '미설정'}")
         
         # 폴링 시작
         for attempt in range(max_attempts):
             try:
-                self.logger.debug(f"Device Code 폴링 시도 {attempt + 1}/{max_attempts}")
-                
-                client_secret_value = getattr(auth_config, 'client_secret', None)
-                self.logger.debug(f"폴링 시 client_secret 전달: {'있음' if client_secret_value else '없음'}")
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug("Device Code 폴링 시도 %d/%d", attempt + 1, max_attempts)
+                    self.logger.debug("폴링 시 client_secret 전달: %s", '있음' if client_secret_value else '없음')
                 
                 token_response = await self.graph_api_client.poll_device_code(
-                    client_id=auth_config.client_id,
-                    tenant_id=auth_config.tenant_id,
+                    client_id=poll_state["cid"],
+                    tenant_id=poll_state["tid"],
                     device_code=device_code,
                     client_secret=client_secret_value,
                 )
                 
-                # 성공 시 토큰 저장
+                # 성공 시 토큰 저장 (계정이 없으면 외래 키 제약으로 실패)
                 token = await self._save_token(account_id, token_response, scope)
                 
                 # 디바이스 코드 캐시 삭제
                 await self.cache_service.delete(cache_key)
                 
-                # 계정 활성화
-                account.activate()
-                await self.account_repository.update(account)
+                # 계정 활성화 (조회 없이 단일 UPDATE)
+                await self.account_repository.update_status(account_id, AccountStatus.ACTIVE)
                 
                 self.logger.info(f"Device Code Flow 완료: {account_id}")
                 return token
                 
-            except Exception as e:
-                error_msg = str(e)
+            except AuthorizationPendingError as e:
+                # 사용자가 아직 인증하지 않은 경우 계속 폴링 (서버가 대기 시간을 알려주면 그 값 사용)
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(
+                        e.retry_after if e.retry_after is not None else interval * DEVICE_POLL_INTERVAL_MARGIN
+                    )
                 
-                # 사용자가 아직 인증하지 않은 경우 계속 폴링
-                if "authorization_pending" in error_msg.lower():
-                    await asyncio.sleep(interval)
-                    continue
+            except SlowDownError as e:
+                # 서버가 폴링 속도를 늦추라고 한 경우 이후 간격을 늘림
+                # (상한은 늘릴 때만 적용하고, 이미 상한보다 긴 간격은 줄이지 않음)
+                interval = max(interval, min(interval + SLOW_DOWN_INCREMENT, MAX_DEVICE_POLL_INTERVAL))
+                poll_state["interval"] = interval
+                # 다시 저장해도 디바이스 코드 만료 시각을 넘기지 않도록 남은 시간만 지정
+                await self.cache_service.set(
+                    cache_key,
+                    json.dumps(poll_state),
+                    expire=max(1, poll_state["expires_at"] - int(time.time())),
+                )
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(max(interval * DEVICE_POLL_INTERVAL_MARGIN, e.retry_after or 0))
                 
+            except AccessDeniedError:
                 # 사용자가 인증을 거부한 경우
-                if "access_denied" in error_msg.lower():
-                    await self.cache_service.delete(cache_key)
-                    raise ValueError("사용자가 인증을 거부했습니다")
+                await self.cache_service.delete(cache_key)
+                raise ValueError("사용자가 인증을 거부했습니다")
                 
+            except ExpiredTokenError:
                 # 디바이스 코드가 만료된 경우
-                if "expired_token" in error_msg.lower():
-                    await self.cache_service.delete(cache_key)
-                    raise ValueError("디바이스 코드가 만료되었습니다")
+                await self.cache_service.delete(cache_key)
+                raise ValueError("디바이스 코드가 만료되었습니다")
                 
+            except Exception as e:
                 # 기타 오류
-                self.logger.error(f"Device Code 폴링 오류: {error_msg}")
-                await asyncio.sleep(interval)
+                self.logger.error(f"Device Code 폴링 오류: {str(e)}")
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(interval * DEVICE_POLL_INTERVAL_MARGIN)
         
         # 최대 시도 횟수 초과
         await self.cache_service.delete(cache_key)
@@ -324,68 +506,68 @@ class AuthenticationUseCase:
         Returns:
             갱신된 토큰 엔티티 또는 None
         """
+        # 같은 계정에 대한 동시 갱신 요청은 하나의 IdP 요청으로 합침
+        return await _coalesce(
+            self._refresh_inflight,
+            account_id,
+            lambda: self._refresh_token(account_id),
+        )
+    
+    async def _refresh_token(self, account_id: UUID) -> Optional[Token]:
+        """토큰 갱신 본문"""
         self.logger.info(f"토큰 갱신 시작: {account_id}")
         
         # 기존 토큰 조회
-        existing_token = await self.token_repository.get_by_account_id(account_id)
+        async with self._session_lock:
+            existing_token = await self.token_repository.get_by_account_id(account_id)
         if not existing_token or not existing_token.can_refresh():
             self.logger.warning(f"갱신할 수 없는 토큰: {account_id}")
             return None
         
-        # 계정 및 인증 설정 조회
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            self.logger.warning(f"계정을 찾을 수 없음: {account_id}")
-            return None
-        
         try:
+            # 계정 및 인증 설정 조회 (단일 쿼리)
+            async with self._session_lock:
+                account, auth_config = await self.auth_config_repository.get_account_with_config(account_id)
+            if not account:
+                self.logger.warning(f"계정을 찾을 수 없음: {account_id}")
+                return None
+            
             if account.auth_type == AuthType.AUTHORIZATION_CODE:
-                auth_config = await self.auth_config_repository.get_auth_code_config(account_id)
                 if not auth_config:
                     return None
-                
-                # 리프레시 토큰 복호화
-                decrypted_refresh_token = await self.encryption_service.decrypt(
-                    existing_token.refresh_token
-                )
-                
-                # 토큰 갱신 요청
-                token_response = await self.graph_api_client.refresh_token(
-                    client_id=auth_config.client_id,
-                    client_secret=auth_config.client_secret,
-                    tenant_id=auth_config.tenant_id,
-                    refresh_token=decrypted_refresh_token,
-                )
+                client_secret = auth_config.client_secret
                 
             elif account.auth_type == AuthType.DEVICE_CODE:
-                auth_config = await self.auth_config_repository.get_device_code_config(account_id)
                 if not auth_config:
                     return None
-                
-                # 리프레시 토큰 복호화
-                decrypted_refresh_token = await self.encryption_service.decrypt(
-                    existing_token.refresh_token
-                )
-                
                 # Device Code Flow에서는 client_secret 없이 갱신
-                token_response = await self.graph_api_client.refresh_token(
-                    client_id=auth_config.client_id,
-                    client_secret=None,
-                    tenant_id=auth_config.tenant_id,
-                    refresh_token=decrypted_refresh_token,
-                )
+                client_secret = None
             
             else:
                 self.logger.error(f"지원하지 않는 인증 타입: {account.auth_type}")
                 return None
             
-            # 새 토큰 저장
-            new_token = await self._save_token(
-                account_id,
-                token_response,
-                existing_token.scope
+            # 리프레시 토큰 복호화
+            decrypted_refresh_token = await self.encryption_service.decrypt(
+                existing_token.refresh_token
             )
             
+            # 토큰 갱신 요청 (네트워크 구간은 세션 락 밖에서 수행하여 동시 갱신 시 겹치도록 함)
+            token_response = await self.graph_api_client.refresh_token(
+                client_id=auth_config.client_id,
+                client_secret=client_secret,
+                tenant_id=auth_config.tenant_id,
+                refresh_token=decrypted_refresh_token,
+            )
+            
+            # 새 토큰 저장
+            async with self._session_lock:
+                new_token = await self._save_token(
+                    account_id,
+                    token_response,
+                    existing_token.scope
+                )
+            
             self.logger.info(f"토큰 갱신 완료: {account_id}")
             return new_token
             
@@ -393,8 +575,8 @@ class AuthenticationUseCase:
             self.logger.error(f"토큰 갱신 실패: {account_id}, 오류: {str(e)}")
             
             # 갱신 실패 시 계정을 오류 상태로 표시
-            account.mark_error()
-            await self.account_repository.update(account)
+            async with self._session_lock:
+                await self.account_repository.update_status(account_id, AccountStatus.ERROR)
             
             return None
     
@@ -410,15 +592,19 @@ class AuthenticationUseCase:
         """
         self.logger.info(f"토큰 폐기: {account_id}")
         
-        # 토큰 삭제
+        # 진행 중인 토큰 갱신이 있으면 끝난 뒤 삭제 (폐기 후에 갱신된 토큰이 다시 저장되는 것 방지)
+        inflight_refresh = self._refresh_inflight.get(account_id)
+        if inflight_refresh is not None:
+            await asyncio.wait([inflight_refresh])
+        
+        # 토큰 삭제 후 복호화 토큰/프로필 캐시도 함께 무효화
         success = await self.token_repository.delete(account_id)
+        self._plain_token_cache.pop(account_id, None)
+        self._profile_cache.pop(account_id, None)
         
         if success:
-            # 계정 비활성화
-            account = await self.account_repository.get_by_id(account_id)
-            if account:
-                account.deactivate()
-                await self.account_repository.update(account)
+            # 계정 비활성화 (조회 없이 단일 UPDATE)
+            await self.account_repository.update_status(account_id, AccountStatus.INACTIVE)
             
             self.logger.info(f"토큰 폐기 완료: {account_id}")
         else:
@@ -438,26 +624,39 @@ class AuthenticationUseCase:
         """
         self.logger.debug(f"사용자 프로필 조회: {account_id}")
         
-        # 토큰 조회
-        token = await self.token_repository.get_by_account_id(account_id)
-        if not token:
-            return None
+        # 최근 조회한 프로필이 있으면 Graph 호출 생략
+        cached_profile = self._profile_cache.get(account_id)
+        if cached_profile and time.monotonic() - cached_profile[0] < USER_PROFILE_CACHE_TTL_SECONDS:
+            return dict(cached_profile[1])
         
-        # 토큰 만료 확인 및 갱신
-        if token.is_expired():
-            token = await self.refresh_token(account_id)
+        # 캐시된 복호화 토큰이 유효하면 DB 조회와 복호화를 생략
+        decrypted_access_token = self._get_cached_access_token(account_id)
+        
+        if decrypted_access_token is None:
+            # 토큰 조회
+            token = await self.token_repository.get_by_account_id(account_id)
             if not token:
                 return None
+            
+            # 토큰 만료 확인 및 갱신
+            if token.is_expired():
+                token = await self.refresh_token(account_id)
+                if not token:
+                    return None
         
         try:
-            # 액세스 토큰 복호화
-            decrypted_access_token = await self.encryption_service.decrypt(
-                token.access_token
-            )
+            if decrypted_access_token is None:
+                # 액세스 토큰 복호화
+                decrypted_access_token = await self._decrypted_access(token)
             
             # 사용자 프로필 조회
             profile = await self.graph_api_client.get_user_profile(decrypted_access_token)
             
+            # 프로필 캐시 저장 (가득 차면 비움)
+            if len(self._profile_cache) >= USER_PROFILE_CACHE_SIZE:
+                self._profile_cache.clear()
+            self._profile_cache[account_id] = (time.monotonic(), dict(profile))
+            
             self.logger.debug(f"사용자 프로필 조회 완료: {account_id}")
             return profile
             
@@ -465,6 +664,45 @@ class AuthenticationUseCase:
             self.logger.error(f"사용자 프로필 조회 실패: {account_id}, 오류: {str(e)}")
             return None
     
+    def _get_cached_access_token(self, account_id: UUID) -> Optional[str]:
+        """만료되지 않은 캐시된 복호화 액세스 토큰을 반환합니다."""
+        entry = self._plain_token_cache.get(account_id)
+        if entry is None:
+            return None
+        
+        plain_token, _, usable_until = entry
+        if time.time() >= usable_until:
+            self._plain_token_cache.pop(account_id, None)
+            return None
+        
+        self._plain_token_cache.move_to_end(account_id)
+        return plain_token
+    
+    async def _decrypted_access(self, token: Token) -> str:
+        """
+        토큰의 액세스 토큰을 복호화합니다.
+        
+        같은 토큰(만료 시간 동일)의 복호화 결과가 사용 기한 내에 캐시되어 있으면 재사용합니다.
+        복호화 실패 시 예외를 그대로 전달합니다.
+        """
+        entry = self._plain_token_cache.get(token.account_id)
+        if entry is not None and entry[1] == token.expires_at and time.time() < entry[2]:
+            self._plain_token_cache.move_to_end(token.account_id)
+            return entry[0]
+        
+        plain_token = await self.encryption_service.decrypt(token.access_token)
+        self._cache_access_token(token.account_id, plain_token, token.expires_at)
+        return plain_token
+    
+    def _cache_access_token(self, account_id: UUID, plain_token: str, expires_at: datetime) -> None:
+        """복호화된 액세스 토큰을 캐시에 저장합니다. (LRU 방식으로 크기 제한)"""
+        # datetime 생성 없이 비교할 수 있도록 epoch 초로 미리 변환
+        usable_until = expires_at.replace(tzinfo=KST).timestamp() - PLAIN_TOKEN_EXPIRY_SKEW_SECONDS
+        self._plain_token_cache[account_id] = (plain_token, expires_at, usable_until)
+        self._plain_token_cache.move_to_end(account_id)
+        if len(self._plain_token_cache) > PLAIN_TOKEN_CACHE_SIZE:
+            self._plain_token_cache.popitem(last=False)
+    
     async def _save_token(
         self,
         account_id: UUID,
@@ -493,10 +731,10 @@ class AuthenticationUseCase:
                 token_response['refresh_token']
             )
         
-        # 만료 시간 계산 (서울 시간)
-        from ..domain.entities import now_kst
+        # 만료 시간 계산 (서울 시간, 일괄 갱신 몰림 방지를 위해 최대 4분 일찍 만료 처리)
         expires_in = token_response.get('expires_in', 3600)
-        expires_at = now_kst() + timedelta(seconds=expires_in)
+        jitter = random.uniform(0, min(expires_in * EXPIRY_JITTER_RATIO, MAX_EXPIRY_JITTER_SECONDS))
+        expires_at = now_kst() + timedelta(seconds=expires_in - jitter)
         
         # 토큰 엔티티 생성
         token = Token(
@@ -508,15 +746,22 @@ class AuthenticationUseCase:
             scope=scope,
         )
         
-        # 토큰 저장
+        # 토큰 저장 (이전 토큰의 복호화 캐시와 프로필 캐시는 무효화)
+        self._plain_token_cache.pop(account_id, None)
+        self._profile_cache.pop(account_id, None)
         return await self.token_repository.save(token)
     
-    async def check_and_refresh_expiring_tokens(self, minutes: int = 5) -> int:
+    async def check_and_refresh_expiring_tokens(
+        self,
+        minutes: int = 5,
+        concurrency: int = REFRESH_CONCURRENCY,
+    ) -> int:
         """
         곧 만료될 토큰들을 확인하고 갱신합니다.
         
         Args:
             minutes: 만료 임박 기준 시간 (분)
+            concurrency: 동시에 갱신할 최대 토큰 수
             
         Returns:
             갱신된 토큰 개수
@@ -526,17 +771,23 @@ class AuthenticationUseCase:
         # 곧 만료될 토큰 목록 조회
         expiring_tokens = await self.token_repository.list_near_expiry_tokens(minutes)
         
-        refreshed_count = 0
-        for token in expiring_tokens:
-            try:
-                refreshed_token = await self.refresh_token(token.account_id)
-                if refreshed_token:
-                    refreshed_count += 1
-                    self.logger.info(f"토큰 자동 갱신 성공: {token.account_id}")
-                else:
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def refresh_one(token: Token) -> bool:
+            async with semaphore:
+                try:
+                    refreshed_token = await self.refresh_token(token.account_id)
+                    if refreshed_token:
+                        self.logger.info(f"토큰 자동 갱신 성공: {token.account_id}")
+                        return True
                     self.logger.warning(f"토큰 자동 갱신 실패: {token.account_id}")
-            except Exception as e:
-                self.logger.error(f"토큰 자동 갱신 오류: {token.account_id}, {str(e)}")
+                except Exception as e:
+                    self.logger.error(f"토큰 자동 갱신 오류: {token.account_id}, {str(e)}")
+                return False
+        
+        # IdP 부하를 제한하면서 동시에 갱신
+        results = await asyncio.gather(*(refresh_one(token) for token in expiring_tokens))
+        refreshed_count = sum(results)
         
         self.logger.info(f"만료 임박 토큰 갱신 완료: {refreshed_count}/{len(expiring_tokens)}")
         return refreshed_count
@@ -558,6 +809,11 @@ class AuthenticationUseCase:
         if not token:
             return None
         
+        # 같은 토큰에 대한 직전 결과가 있으면 복호화/JWT 파싱 생략
+        memo = self._get_status_memo("status", token)
+        if memo is not None:
+            return memo
+        
         try:
             # 기본 토큰 정보
             status = {
@@ -576,7 +832,7 @@ class AuthenticationUseCase:
             # 암호화된 토큰인 경우 복호화하여 JWT 정보 추출
             if token.is_encrypted():
                 try:
-                    decrypted_token = await self.encryption_service.decrypt(token.access_token)
+                    decrypted_token = await self._decrypted_access(token)
                     status["is_jwt"] = token.is_jwt_token(decrypted_token)
                     
                     if status["is_jwt"]:
@@ -588,19 +844,14 @@ class AuthenticationUseCase:
                             # JWT와 DB 만료 시간 비교
                             time_diff = abs((jwt_expiry - token.expires_at).total_seconds())
                             status["expiry_time_diff_seconds"] = time_diff
-                            status["expiry_times_match"] = time_diff < 60  # 1분 이내 차이면 일치로 간주
+                            # 저장 시 지터를 뺀 1분 이내 차이면 일치로 간주
+                            status["expiry_times_match"] = time_diff < 60 + MAX_EXPIRY_JITTER_SECONDS
                         
                         # JWT 페이로드 정보 추출
                         try:
-                            import json
-                            import base64
-                            
-                            parts = decrypted_token.split('.')
-                            if len(parts) == 3:
-                                payload = parts[1]
-                                payload += '=' * (4 - len(payload) % 4)
-                                decoded_bytes = base64.urlsafe_b64decode(payload)
-                                payload_data = json.loads(decoded_bytes.decode('utf-8'))
+                            parsed = parse_jwt(decrypted_token)
+                            if parsed:
+                                payload_data = parsed[1]
                                 
                                 status["jwt_payload"] = {
                                     "iss": payload_data.get("iss"),
@@ -622,6 +873,7 @@ class AuthenticationUseCase:
                 # 암호화되지 않은 토큰
                 status["is_jwt"] = token.is_jwt_token()
             
+            self._put_status_memo("status", token, status)
             return status
             
         except Exception as e:
@@ -655,13 +907,18 @@ class AuthenticationUseCase:
         if not token:
             return result
         
+        # 같은 토큰에 대한 직전 결과가 있으면 복호화/JWT 파싱 생략
+        memo = self._get_status_memo("integrity", token)
+        if memo is not None:
+            return memo
+        
         result["token_exists"] = True
         result["is_encrypted"] = token.is_encrypted()
         
         try:
             if token.is_encrypted():
                 # 복호화 시도
-                decrypted_token = await self.encryption_service.decrypt(token.access_token)
+                decrypted_token = await self._decrypted_access(token)
                 result["decryption_success"] = True
                 
                 # JWT 유효성 검증
@@ -701,8 +958,43 @@ class AuthenticationUseCase:
         except Exception as e:
             self.logger.error(f"토큰 무결성 검증 실패: {account_id}, 오류: {str(e)}")
         
+        self._put_status_memo("integrity", token, result)
         return result
     
+    @staticmethod
+    def _token_fingerprint(token: Token) -> tuple:
+        """토큰 내용이 바뀌었는지 판단하기 위한 값 (저장할 때마다 암호문이 새로 생성됨)"""
+        return (token.access_token, token.refresh_token, token.updated_at)
+    
+    def _get_status_memo(self, kind: str, token: Token) -> Optional[Dict]:
+        """같은 토큰에 대해 TTL 이내에 계산된 결과가 있으면 복사본을 반환합니다. (중첩 dict 포함)"""
+        entry = self._status_memo.get((kind, token.account_id))
+        if entry is None:
+            return None
+        
+        fingerprint, stored_at, result = entry
+        if fingerprint != self._token_fingerprint(token):
+            return None
+        if time.monotonic() - stored_at > TOKEN_STATUS_MEMO_TTL_SECONDS:
+            return None
+        
+        return copy.deepcopy(result)
+    
+    def _put_status_memo(self, kind: str, token: Token, result: Dict) -> None:
+        """조회 결과를 저장합니다. 가득 차면 만료된 항목을 먼저 정리합니다."""
+        now = time.monotonic()
+        if len(self._status_memo) >= TOKEN_STATUS_MEMO_SIZE:
+            expired = [
+                key for key, (_, stored_at, _) in self._status_memo.items()
+                if now - stored_at > TOKEN_STATUS_MEMO_TTL_SECONDS
+            ]
+            for key in expired:
+                del self._status_memo[key]
+            if len(self._status_memo) >= TOKEN_STATUS_MEMO_SIZE:
+                self._status_memo.clear()
+        
+        self._status_memo[(kind, token.account_id)] = (self._token_fingerprint(token), now, copy.deepcopy(result))
+    
     async def log_raw_token_values(self, account_id: UUID) -> Dict[str, str]:
         """
         토큰의 원본 값들을 로그로 출력합니다.
@@ -713,12 +1005,15 @@ class AuthenticationUseCase:
         Returns:
             토큰 원본 값들이 포함된 딕셔너리
         """
-        self.logger.info(f"토큰 원본 값 로그 출력 시작: {account_id}")
+        # INFO 로그가 꺼져 있으면 로그 문자열 생성 작업을 건너뜀 (반환값은 동일)
+        log_enabled = self.logger.is_enabled_for(logging.INFO)
+        if log_enabled:
+            self.logger.info("토큰 원본 값 로그 출력 시작: %s", account_id)
         
         # 토큰 조회
         token = await self.token_repository.get_by_account_id(account_id)
         if not token:
-            self.logger.warning(f"토큰을 찾을 수 없음: {account_id}")
+            self.logger.warning("토큰을 찾을 수 없음: %s", account_id)
             return {"error": "토큰을 찾을 수 없습니다"}
         
         result = {
@@ -730,85 +1025,88 @@ class AuthenticationUseCase:
         }
         
         try:
-            # 암호화된 액세스 토큰 복호화
+            # 암호화된 액세스/리프레시 토큰을 한 번에 복호화
             if token.is_encrypted():
-                decrypted_access_token = await self.encryption_service.decrypt(token.access_token)
+                encrypted_values = [token.access_token]
+                if token.refresh_token:
+                    encrypted_values.append(token.refresh_token)
+                decrypted_values = await self.encryption_service.decrypt_many(encrypted_values)
+                decrypted_access_token = decrypted_values[0]
+                
                 result["encrypted_access_token"] = token.access_token
                 result["decrypted_access_token"] = decrypted_access_token
                 
-                self.logger.info(f"[토큰 원본] 계정 ID: {account_id}")
-                self.logger.info(f"[토큰 원본] 암호화된 액세스 토큰: {token.access_token}")
-                self.logger.info(f"[토큰 원본] 복호화된 액세스 토큰: {decrypted_access_token}")
+                if log_enabled:
+                    self.logger.info("[토큰 원본] 계정 ID: %s", account_id)
+                    self.logger.info("[토큰 원본] 암호화된 액세스 토큰: %s", token.access_token)
+                    self.logger.info("[토큰 원본] 복호화된 액세스 토큰: %s", decrypted_access_token)
                 
                 # 리프레시 토큰이 있는 경우
                 if token.refresh_token:
-                    decrypted_refresh_token = await self.encryption_service.decrypt(token.refresh_token)
+                    decrypted_refresh_token = decrypted_values[1]
                     result["encrypted_refresh_token"] = token.refresh_token
                     result["decrypted_refresh_token"] = decrypted_refresh_token
                     
-                    self.logger.info(f"[토큰 원본] 암호화된 리프레시 토큰: {token.refresh_token}")
-                    self.logger.info(f"[토큰 원본] 복호화된 리프레시 토큰: {decrypted_refresh_token}")
+                    if log_enabled:
+                        self.logger.info("[토큰 원본] 암호화된 리프레시 토큰: %s", token.refresh_token)
+                        self.logger.info("[토큰 원본] 복호화된 리프레시 토큰: %s", decrypted_refresh_token)
                 
                 # JWT 토큰인 경우 페이로드 정보도 출력
                 if token.is_jwt_token(decrypted_access_token):
-                    self.logger.info(f"[토큰 원본] JWT 토큰 확인됨")
+                    if log_enabled:
+                        self.logger.info("[토큰 원본] JWT 토큰 확인됨")
                     
                     try:
-                        import json
-                        import base64
-                        
-                        parts = decrypted_access_token.split('.')
-                        if len(parts) == 3:
-                            # Header 디코딩
-                            header = parts[0]
-                            header += '=' * (4 - len(header) % 4)
-                            header_data = json.loads(base64.urlsafe_b64decode(header).decode('utf-8'))
-                            
-                            # Payload 디코딩
-                            payload = parts[1]
-                            payload += '=' * (4 - len(payload) % 4)
-                            payload_data = json.loads(base64.urlsafe_b64decode(payload).decode('utf-8'))
+                        parsed = parse_jwt(decrypted_access_token)
+                        if parsed:
+                            header_data, payload_data, jwt_expiry = parsed
                             
                             result["jwt_header"] = header_data
                             result["jwt_payload"] = payload_data
                             
-                            self.logger.info(f"[토큰 원본] JWT Header: {json.dumps(header_data, indent=2)}")
-                            self.logger.info(f"[토큰 원본] JWT Payload: {json.dumps(payload_data, indent=2)}")
-                            
-                            # 만료 시간 비교 - Token 클래스의 메서드 사용
-                            jwt_expiry = token.extract_jwt_expiry(decrypted_access_token)
-                            if jwt_expiry:
-                                self.logger.info(f"[토큰 원본] JWT 만료 시간: {jwt_expiry.isoformat()}")
-                                self.logger.info(f"[토큰 원본] DB 만료 시간: {token.expires_at.isoformat()}")
+                            if log_enabled:
+                                self.logger.info("[토큰 원본] JWT Header: %s", json.dumps(header_data, indent=2))
+                                self.logger.info("[토큰 원본] JWT Payload: %s", json.dumps(payload_data, indent=2))
                                 
-                                time_diff = abs((jwt_expiry - token.expires_at).total_seconds())
-                                self.logger.info(f"[토큰 원본] 만료 시간 차이: {time_diff}초")
+                                # 만료 시간 비교
+                                if jwt_expiry:
+                                    self.logger.info("[토큰 원본] JWT 만료 시간: %s", jwt_expiry.isoformat())
+                                    self.logger.info("[토큰 원본] DB 만료 시간: %s", token.expires_at.isoformat())
+                                    
+                                    time_diff = abs((jwt_expiry - token.expires_at).total_seconds())
+                                    self.logger.info("[토큰 원본] 만료 시간 차이: %s초", time_diff)
+                        else:
+                            result["jwt_parse_error"] = "JWT 헤더/페이로드 디코딩 실패"
                     
                     except Exception as e:
-                        self.logger.error(f"JWT 파싱 실패: {str(e)}")
+                        self.logger.error("JWT 파싱 실패: %s", e)
                         result["jwt_parse_error"] = str(e)
             else:
                 # 암호화되지 않은 토큰
                 result["access_token"] = token.access_token
-                self.logger.info(f"[토큰 원본] 계정 ID: {account_id}")
-                self.logger.info(f"[토큰 원본] 액세스 토큰 (암호화되지 않음): {token.access_token}")
+                if log_enabled:
+                    self.logger.info("[토큰 원본] 계정 ID: %s", account_id)
+                    self.logger.info("[토큰 원본] 액세스 토큰 (암호화되지 않음): %s", token.access_token)
                 
                 if token.refresh_token:
                     result["refresh_token"] = token.refresh_token
-                    self.logger.info(f"[토큰 원본] 리프레시 토큰 (암호화되지 않음): {token.refresh_token}")
+                    if log_enabled:
+                        self.logger.info("[토큰 원본] 리프레시 토큰 (암호화되지 않음): %s", token.refresh_token)
             
             # 토큰 상태 정보
-            self.logger.info(f"[토큰 원본] 토큰 타입: {token.token_type}")
-            self.logger.info(f"[토큰 원본] 권한 범위: {token.scope}")
-            self.logger.info(f"[토큰 원본] 생성 시간: {token.created_at.isoformat()}")
-            self.logger.info(f"[토큰 원본] 만료 시간: {token.expires_at.isoformat()}")
-            self.logger.info(f"[토큰 원본] 만료 여부: {token.is_expired()}")
-            self.logger.info(f"[토큰 원본] 갱신 가능 여부: {token.can_refresh()}")
+            if log_enabled:
+                self.logger.info("[토큰 원본] 토큰 타입: %s", token.token_type)
+                self.logger.info("[토큰 원본] 권한 범위: %s", token.scope)
+                self.logger.info("[토큰 원본] 생성 시간: %s", token.created_at.isoformat())
+                self.logger.info("[토큰 원본] 만료 시간: %s", token.expires_at.isoformat())
+                self.logger.info("[토큰 원본] 만료 여부: %s", token.is_expired())
+                self.logger.info("[토큰 원본] 갱신 가능 여부: %s", token.can_refresh())
             
         except Exception as e:
             error_msg = f"토큰 복호화 실패: {str(e)}"
-            self.logger.error(f"[토큰 원본] {error_msg}")
+            self.logger.error("[토큰 원본] %s", error_msg)
             result["error"] = error_msg
         
-        self.logger.info(f"토큰 원본 값 로그 출력 완료: {account_id}")
+        if log_enabled:
+            self.logger.info("토큰 원본 값 로그 출력 완료: %s", account_id)
         return result
@@ -5,8 +5,12 @@ Microsoft 365 메일 조회, 발송, 동기화 등의 비즈니스 로직을 구
 데이터베이스에서 계정 정보와 토큰을 조회하여 메일 처리를 수행합니다.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 from ..domain.entities import (
@@ -28,11 +32,98 @@ from ..domain.ports import (
     SyncHistoryRepositoryPort,
     TokenRepositoryPort,
 )
+from .authentication import AuthenticationUseCase
+
+# 메시지 데이터에 없는 하위 객체 대신 사용하는 빈 dict (읽기 전용)
+_EMPTY: Dict = {}
+
+try:
+    # 설치되어 있으면 더 빠른 ciso8601 사용 (pip install .[fast])
+    from ciso8601 import parse_datetime as _parse_graph_datetime
+except ImportError:
+    # Python 3.11+ fromisoformat은 Graph의 'Z' 접미사를 문자열 치환 없이 처리
+    _parse_graph_datetime = datetime.fromisoformat
+
+# Graph 메시지 조회 시 요청할 필드 ($select, _convert_message_to_mail에서 사용하는 필드만)
+SYNC_SELECT_FIELDS = [
+    "id",
+    "subject",
+    "sender",
+    "toRecipients",
+    "ccRecipients",
+    "bccRecipients",
+    "body",
+    "bodyPreview",
+    "importance",
+    "isRead",
+    "hasAttachments",
+    "receivedDateTime",
+    "sentDateTime",
+]
+
+# 전체 동기화 시 JSON $batch 요청 하나로 조회할 페이지 수
+# (하위 요청은 같은 사서함에 동시에 실행되므로 Outlook 사서함 동시 요청 한도 4개를 넘지 않음)
+SYNC_BATCH_PAGES = 4
+
+# 전체 동기화 시 처리 중인 묶음 외에 미리 조회해 둘 $batch 묶음 수
+SYNC_PREFETCH_BATCHES = 1
+
+# 일괄 전송 실패 시 개별 전송으로 동시에 보낼 최대 메일 수
+EXTERNAL_SEND_CONCURRENCY = 16
+
+# 메시지 변환을 스레드에서 수행할 최소 페이지 크기
+CONVERT_IN_THREAD_MIN_MESSAGES = 500
+
+# 메시지 ID로 조회한 메일 캐시 최대 항목 수 (LRU)
+MAIL_CACHE_SIZE = 4096
+
+# 토큰 조회 결과 캐시 유지 시간 (초) 과 최대 항목 수 (가득 차면 비움)
+TOKEN_CACHE_TTL_SECONDS = 5.0
+TOKEN_CACHE_SIZE = 10_000
+
+
+def _format_graph_datetime(value: datetime) -> str:
+    """OData 필터용 UTC 시각 문자열을 반환합니다. (시간대 없는 값은 UTC로 간주)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec='microseconds') + 'Z'
+
+
+@lru_cache(maxsize=256)
+def _compose_filter(
+    filter_query: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+) -> str:
+    """
+    필터 쿼리와 수신 시각 범위(UTC 문자열)를 하나의 OData 필터로 합칩니다.
+    
+    같은 조건으로 반복 조회할 때 문자열을 다시 만들지 않도록 결과를 캐시합니다.
+    """
+    filters = []
+    
+    if start:
+        filters.append(f"receivedDateTime ge {start}")
+    
+    if end:
+        filters.append(f"receivedDateTime le {end}")
+    
+    date_filter = " and ".join(filters)
+    if filter_query:
+        return f"({filter_query}) and ({date_filter})"
+    return date_filter
 
 
 class MailProcessingUseCase:
     """메일 처리 유즈케이스"""
     
+    # (계정 ID, 메시지 ID)별 조회한 메일
+    # 유즈케이스는 요청 단위로 생성되므로 프로세스 전역(클래스 속성 LRU)으로 공유
+    _mail_cache: "OrderedDict[Tuple[UUID, str], Mail]" = OrderedDict()
+    
+    # 계정별 (조회 시각, 토큰) (프로세스 전역, 계정 상태는 매번 새로 조회)
+    _token_cache: Dict[UUID, Tuple[float, Token]] = {}
+    
     def __init__(
         self,
         account_repository: AccountRepositoryPort,
@@ -43,6 +134,7 @@ class MailProcessingUseCase:
         graph_api_client: GraphApiClientPort,
         encryption_service: EncryptionServicePort,
         external_api_client: ExternalApiClientPort,
+        authentication_usecase: AuthenticationUseCase,
         logger: LoggerPort,
     ):
         self.account_repository = account_repository
@@ -53,6 +145,8 @@ class MailProcessingUseCase:
         self.graph_api_client = graph_api_client
         self.encryption_service = encryption_service
         self.external_api_client = external_api_client
+        # 토큰 갱신은 인증 설정 저장소까지 갖춘 AuthenticationUseCase에 위임
+        self.authentication_usecase = authentication_usecase
         self.logger = logger
     
     async def list_mails(
@@ -86,50 +180,19 @@ class MailProcessingUseCase:
         """
         self.logger.info(f"메일 목록 조회 시작: {account_id}")
         
-        # 계정 조회
-        account = await self.account_repository.get_by_id(account_id)
-        if not account:
-            raise ValueError(f"계정을 찾을 수 없습니다: {account_id}")
-        
-        if not account.can_sync():
-            raise ValueError(f"동기화할 수 없는 계정 상태입니다: {account.status}")
-        
-        # 데이터베이스에서 토큰 조회
-        token = await self.token_repository.get_by_account_id(account_id)
-        if not token:
-            raise ValueError(f"토큰을 찾을 수 없습니다: {account_id}")
-        
-        # 토큰 만료 확인 및 갱신
-        if token.is_expired():
-            self.logger.info(f"토큰이 만료되어 갱신 시도: {account_id}")
-            # 토큰 갱신은 AuthenticationUseCase에서 처리
-            from .authentication import AuthenticationUseCase
-            auth_usecase = AuthenticationUseCase(
-                self.account_repository,
-                None,  # auth_config_repository는 여기서 필요없음
-                self.token_repository,
-                self.graph_api_client,
-                self.encryption_service,
-                None,  # cache_service는 여기서 필요없음
-                self.logger,
-            )
-            token = await auth_usecase.refresh_token(account_id)
-            if not token:
-                raise ValueError(f"토큰 갱신에 실패했습니다: {account_id}")
+        # 계정/토큰 조회 (만료된 토큰은 갱신)
+        _, _, decrypted_access_token = await self._load_auth_context(
+            account_id, refresh_expired=True
+        )
         
         try:
-            # 액세스 토큰 복호화
-            decrypted_access_token = await self.encryption_service.decrypt(
-                token.access_token
-            )
-            
             # 날짜 필터 구성
             if start_date or end_date:
-                date_filter = self._build_date_filter(start_date, end_date)
-                if filter_query:
-                    filter_query = f"({filter_query}) and ({date_filter})"
-                else:
-                    filter_query = date_filter
+                filter_query = _compose_filter(
+                    filter_query,
+                    _format_graph_datetime(start_date) if start_date else None,
+                    _format_graph_datetime(end_date) if end_date else None,
+                )
             
             # Graph API로 메일 목록 조회
             response = await self.graph_api_client.list_messages(
@@ -138,6 +201,7 @@ class MailProcessingUseCase:
                 skip=skip,
                 filter_query=filter_query,
                 order_by=order_by or "receivedDateTime desc",
+                select=SYNC_SELECT_FIELDS,
             )
             
             # 응답 데이터를 Mail 엔티티로 변환
@@ -170,37 +234,33 @@ class MailProcessingUseCase:
         """
         self.logger.debug(f"메일 조회: {account_id}, {message_id}")
         
+        # 최근 조회한 메일이면 DB 조회 생략
+        cache_key = (account_id, message_id)
+        cached_mail = self._mail_cache.get(cache_key)
+        if cached_mail is not None:
+            self._mail_cache.move_to_end(cache_key)
+            return cached_mail.model_copy()
+        
         # 먼저 데이터베이스에서 조회
         existing_mail = await self.mail_repository.get_by_message_id(account_id, message_id)
         if existing_mail:
+            self._cache_mail(existing_mail)
             return existing_mail
         
         # 데이터베이스에 없으면 Graph API에서 조회
-        account = await self.account_repository.get_by_id(account_id)
-        if not account or not account.can_sync():
-            return None
-        
-        token = await self.token_repository.get_by_account_id(account_id)
-        if not token:
-            return None
-        
-        # 토큰 만료 확인
-        if token.is_expired():
-            return None
-        
         try:
-            decrypted_access_token = await self.encryption_service.decrypt(
-                token.access_token
-            )
+            _, _, decrypted_access_token = await self._load_auth_context(account_id)
             
             message_data = await self.graph_api_client.get_message(
                 access_token=decrypted_access_token,
                 message_id=message_id,
+                select=SYNC_SELECT_FIELDS,
             )
             
             # Mail 엔티티로 변환 및 저장
             mail = self._convert_message_to_mail(account_id, message_data)
             saved_mail = await self.mail_repository.create(mail)
+            self._cache_mail(saved_mail)
             
             self.logger.debug(f"메일 조회 및 저장 완료: {account_id}, {message_id}")
             return saved_mail
@@ -239,23 +299,9 @@ class MailProcessingUseCase:
         self.logger.info(f"메일 발송 시작: {account_id}")
         
         # 계정 및 토큰 조회
-        account = await self.account_repository.get_by_id(account_id)
-        if not account or not account.can_sync():
-            raise ValueError(f"메일을 발송할 수 없는 계정 상태입니다: {account_id}")
-        
-        token = await self.token_repository.get_by_account_id(account_id)
-        if not token:
-            raise ValueError(f"토큰을 찾을 수 없습니다: {account_id}")
-        
-        # 토큰 만료 확인
-        if token.is_expired():
-            raise ValueError(f"토큰이 만료되었습니다: {account_id}")
+        _, _, decrypted_access_token = await self._load_auth_context(account_id)
         
         try:
-            decrypted_access_token = await self.encryption_service.decrypt(
-                token.access_token
-            )
-            
             # 메일 데이터 구성
             message_data = {
                 "message": {
@@ -323,21 +369,7 @@ class MailProcessingUseCase:
         
         try:
             # 계정 및 토큰 조회
-            account = await self.account_repository.get_by_id(account_id)
-            if not account or not account.can_sync():
-                raise ValueError(f"동기화할 수 없는 계정 상태입니다: {account_id}")
-            
-            token = await self.token_repository.get_by_account_id(account_id)
-            if not token:
-                raise ValueError(f"토큰을 찾을 수 없습니다: {account_id}")
-            
-            # 토큰 만료 확인
-            if token.is_expired():
-                raise ValueError(f"토큰이 만료되었습니다: {account_id}")
-            
-            decrypted_access_token = await self.encryption_service.decrypt(
-                token.access_token
-            )
+            _, _, decrypted_access_token = await self._load_auth_context(account_id)
             
             processed_count = 0
             error_count = 0
@@ -356,20 +388,42 @@ class MailProcessingUseCase:
                     response = await self.graph_api_client.list_messages(
                         access_token=decrypted_access_token,
                         top=batch_size,
+                        select=SYNC_SELECT_FIELDS,
                     )
                 
-                # 메일 처리
-                for message_data in response.get('value', []):
+                while True:
+                    # 델타 응답은 @odata.nextLink로 이어지다가 마지막 페이지에서 @odata.deltaLink를 반환
+                    # 현재 페이지를 처리하는 동안 다음 페이지를 미리 조회 (Graph 조회는 DB 세션을 사용하지 않음)
+                    next_link = response.get('@odata.nextLink') if delta_link_entity else None
+                    next_page = asyncio.create_task(
+                        self.graph_api_client.get_next_page(
+                            access_token=decrypted_access_token,
+                            url=next_link,
+                        )
+                    ) if next_link else None
+                    
+                    # 메일 처리
                     try:
-                        await self._process_message(account_id, message_data)
-                        processed_count += 1
-                    except Exception as e:
-                        self.logger.error(f"메시지 처리 오류: {message_data.get('id')}, {str(e)}")
-                        error_count += 1
+                        processed, errors = await self._process_messages(
+                            account_id, response.get('value', [])
+                        )
+                    except BaseException:
+                        if next_page is not None:
+                            next_page.cancel()
+                        raise
+                    processed_count += processed
+                    error_count += errors
+                    
+                    if next_page is None:
+                        break
+                    
+                    response = await next_page
                 
-                # 새 델타 링크 저장
+                # 새 델타 링크 저장 (변경 사항이 없어 같은 링크가 반환되면 쓰기 생략)
                 new_delta_link = response.get('@odata.deltaLink')
-                if new_delta_link:
+                if new_delta_link and (
+                    not delta_link_entity or delta_link_entity.delta_link != new_delta_link
+                ):
                     if delta_link_entity:
                         delta_link_entity.update_link(new_delta_link)
                         await self.delta_link_repository.update(delta_link_entity)
@@ -382,32 +436,9 @@ class MailProcessingUseCase:
             
             else:
                 # 전체 동기화
-                skip = 0
-                while True:
-                    response = await self.graph_api_client.list_messages(
-                        access_token=decrypted_access_token,
-                        top=batch_size,
-                        skip=skip,
-                        order_by="receivedDateTime desc",
-                    )
-                    
-                    messages = response.get('value', [])
-                    if not messages:
-                        break
-                    
-                    for message_data in messages:
-                        try:
-                            await self._process_message(account_id, message_data)
-                            processed_count += 1
-                        except Exception as e:
-                            self.logger.error(f"메시지 처리 오류: {message_data.get('id')}, {str(e)}")
-                            error_count += 1
-                    
-                    skip += batch_size
-                    
-                    # 배치 크기보다 적게 반환되면 마지막 페이지
-                    if len(messages) < batch_size:
-                        break
+                processed_count, error_count = await self._sync_all_messages(
+                    account_id, decrypted_access_token, batch_size
+                )
             
             # 동기화 완료 처리
             sync_history.processed_count = processed_count
@@ -415,8 +446,8 @@ class MailProcessingUseCase:
             sync_history.mark_as_completed()
             
             # 계정 마지막 동기화 시간 업데이트
-            account.last_sync_at = datetime.utcnow()
-            await self.account_repository.update(account)
+            # (캐시된 계정 사본으로 전체 컬럼을 덮어쓰면 그 사이 바뀐 상태가 되돌려지므로 해당 컬럼만 갱신)
+            await self.account_repository.update_last_sync_at(account_id, datetime.utcnow())
             
             self.logger.info(f"메일 동기화 완료: {account_id}, 처리: {processed_count}, 오류: {error_count}")
             
@@ -427,50 +458,306 @@ class MailProcessingUseCase:
         # 동기화 이력 업데이트
         return await self.sync_history_repository.update(sync_history)
     
-    async def _process_message(self, account_id: UUID, message_data: Dict) -> None:
+    async def _sync_all_messages(
+        self,
+        account_id: UUID,
+        access_token: str,
+        batch_size: int,
+    ) -> Tuple[int, int]:
         """
-        메시지 데이터를 처리합니다.
+        전체 메시지를 페이지 단위로 조회하여 처리합니다.
+        
+        Graph 조회(생산자)와 페이지 처리(소비자)를 큐로 연결해 다음 페이지 묶음을 조회하는 동안
+        현재 묶음을 처리합니다. DB 작업은 소비자에서만 수행하므로 공유 DB 세션을 동시에 사용하지 않습니다.
         
         Args:
             account_id: 계정 ID
-            message_data: Graph API 메시지 데이터
+            access_token: 복호화된 액세스 토큰
+            batch_size: 페이지 크기
+            
+        Returns:
+            (처리 건수, 오류 건수)
         """
-        message_id = message_data.get('id')
-        
-        # 이미 존재하는 메일인지 확인
-        existing_mail = await self.mail_repository.exists_by_message_id(account_id, message_id)
-        if existing_mail:
-            self.logger.debug(f"이미 존재하는 메일: {message_id}")
-            return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SYNC_PREFETCH_BATCHES)
         
-        # Mail 엔티티로 변환
-        mail = self._convert_message_to_mail(account_id, message_data)
+        async def produce() -> None:
+            try:
+                skip = 0
+                while True:
+                    # 여러 페이지를 JSON $batch 요청 한 번으로 조회
+                    pages = [
+                        (batch_size, skip + i * batch_size)
+                        for i in range(SYNC_BATCH_PAGES)
+                    ]
+                    responses = await self.graph_api_client.batch_list_messages(
+                        access_token=access_token,
+                        pages=pages,
+                        order_by="receivedDateTime desc",
+                        select=SYNC_SELECT_FIELDS,
+                    )
+                    
+                    page_messages = []
+                    for response in responses:
+                        messages = response.get('value', [])
+                        page_messages.append(messages)
+                        
+                        # 배치 크기보다 적게 반환되면 마지막 페이지
+                        if len(messages) < batch_size:
+                            await queue.put(page_messages)
+                            await queue.put(None)
+                            return
+                    
+                    await queue.put(page_messages)
+                    skip += len(pages) * batch_size
+            except Exception:
+                # 소비자가 대기 상태로 남지 않도록 종료 표시 후 오류 전달
+                await queue.put(None)
+                raise
         
-        # 데이터베이스에 저장
-        saved_mail = await self.mail_repository.create(mail)
+        processed_count = 0
+        error_count = 0
         
-        # 외부 API로 전송
+        producer = asyncio.create_task(produce())
         try:
-            mail_data = {
-                "account_id": str(account_id),
-                "message_id": message_id,
-                "subject": mail.subject,
-                "sender": mail.sender,
-                "recipients": mail.recipients,
-                "received_at": mail.received_at.isoformat(),
-                "body_preview": mail.body_preview,
-            }
+            while (page_messages := await queue.get()) is not None:
+                for messages in page_messages:
+                    processed, errors = await self._process_messages(account_id, messages)
+                    processed_count += processed
+                    error_count += errors
+        except BaseException:
+            producer.cancel()
+            raise
+        
+        # 조회 중 발생한 오류 전달
+        await producer
+        
+        return processed_count, error_count
+    
+    async def _process_messages(
+        self,
+        account_id: UUID,
+        messages: List[Dict],
+    ) -> Tuple[int, int]:
+        """
+        한 페이지의 메시지들을 처리합니다.
+        
+        중복 확인, 저장, 외부 API 전송, 처리 완료 표시를 각각 페이지 단위로 한 번씩 수행합니다.
+        저장에 성공한 메일만 전송하므로 저장 실패 후 다음 동기화에서 같은 메일이 다시 전송되지 않습니다.
+        
+        Args:
+            account_id: 계정 ID
+            messages: Graph API 메시지 데이터 목록
             
-            success = await self.external_api_client.send_mail_data(mail_data)
-            if success:
-                saved_mail.mark_as_processed()
-                await self.mail_repository.update(saved_mail)
-                self.logger.debug(f"메일 외부 전송 완료: {message_id}")
-            else:
-                self.logger.warning(f"메일 외부 전송 실패: {message_id}")
-                
+        Returns:
+            (처리 건수, 오류 건수)
+        """
+        # 이미 저장된 메일을 IN 쿼리 한 번으로 확인
+        existing_ids = await self.mail_repository.exists_many(
+            account_id, [message_data.get('id') for message_data in messages]
+        )
+        
+        if len(messages) >= CONVERT_IN_THREAD_MIN_MESSAGES:
+            # 큰 페이지는 변환(CPU 작업) 동안 이벤트 루프가 멈추지 않도록 스레드에서 수행
+            new_mails, processed_count, error_count = await asyncio.to_thread(
+                self._convert_new_messages, account_id, messages, existing_ids
+            )
+        else:
+            new_mails, processed_count, error_count = self._convert_new_messages(
+                account_id, messages, existing_ids
+            )
+        
+        # 새 메일을 한 번에 저장 (미처리 상태)
+        try:
+            saved_mails = await self.mail_repository.create_many(new_mails) if new_mails else []
         except Exception as e:
-            self.logger.error(f"메일 외부 전송 오류: {message_id}, {str(e)}")
+            self.logger.error(f"메일 일괄 저장 오류: {len(new_mails)}개, {str(e)}")
+            return processed_count - len(new_mails), error_count + len(new_mails)
+        
+        if not saved_mails:
+            return processed_count, error_count
+        
+        # 외부 API로 페이지 단위 일괄 전송
+        try:
+            results = await self.external_api_client.send_mail_data_bulk(
+                [self._build_mail_data(account_id, mail) for mail in saved_mails]
+            )
+        except Exception as e:
+            # 일시적인 오류로 페이지 전체가 미처리로 남지 않도록 개별 전송으로 재시도
+            self.logger.error(
+                f"메일 외부 일괄 전송 오류, 개별 전송으로 재시도: {len(saved_mails)}개, {str(e)}",
+                exc_info=True,
+            )
+            results = await self._send_mails_individually(account_id, saved_mails)
+        
+        sent_mails = [mail for mail, success in zip(saved_mails, results) if success]
+        sent_ids = [mail.id for mail in sent_mails]
+        if len(sent_ids) < len(saved_mails):
+            self.logger.warning(f"메일 외부 전송 실패: {len(saved_mails) - len(sent_ids)}개")
+        
+        # 전송에 성공한 메일을 단일 UPDATE로 처리 완료 표시
+        if sent_ids:
+            try:
+                await self.mail_repository.mark_processed_many(sent_ids)
+                for mail in sent_mails:
+                    self._invalidate_mail(account_id, mail.message_id)
+                self.logger.debug(f"메일 외부 전송 완료: {len(sent_ids)}개")
+            except Exception as e:
+                self.logger.error(f"메일 처리 상태 저장 오류: {len(sent_ids)}개, {str(e)}")
+        
+        return processed_count, error_count
+    
+    async def _send_mails_individually(self, account_id: UUID, mails: List[Mail]) -> List[bool]:
+        """
+        메일을 한 건씩 외부 API로 전송합니다. (일괄 전송 실패 시 대체 경로)
+        
+        DB를 사용하지 않으므로 세마포어로 동시 실행 수만 제한해 동시에 전송합니다.
+        
+        Args:
+            account_id: 계정 ID
+            mails: 전송할 메일 목록
+            
+        Returns:
+            메일별 전송 성공 여부 (같은 순서)
+        """
+        semaphore = asyncio.Semaphore(EXTERNAL_SEND_CONCURRENCY)
+        
+        async def send(mail: Mail) -> bool:
+            async with semaphore:
+                try:
+                    return await self.external_api_client.send_mail_data(
+                        self._build_mail_data(account_id, mail)
+                    )
+                except Exception as e:
+                    self.logger.error(f"메일 외부 전송 오류: {mail.message_id}, {str(e)}", exc_info=True)
+                    return False
+        
+        return await asyncio.gather(*(send(mail) for mail in mails))
+    
+    def _convert_new_messages(
+        self,
+        account_id: UUID,
+        messages: List[Dict],
+        existing_ids: Set[str],
+    ) -> Tuple[List[Mail], int, int]:
+        """
+        저장되지 않은 메시지들을 Mail 엔티티로 변환합니다.
+        
+        Args:
+            account_id: 계정 ID
+            messages: Graph API 메시지 데이터 목록
+            existing_ids: 이미 저장된 메시지 ID 집합 (변환한 메시지 ID가 추가됨)
+        
+        Returns:
+            (새 메일 목록, 처리 건수, 오류 건수)
+        """
+        processed_count = 0
+        error_count = 0
+        new_mails = []
+        
+        for message_data in messages:
+            message_id = message_data.get('id')
+            if message_id in existing_ids:
+                self.logger.debug(f"이미 존재하는 메일: {message_id}")
+                processed_count += 1
+                continue
+            
+            try:
+                new_mails.append(self._convert_message_to_mail(account_id, message_data))
+                existing_ids.add(message_id)
+                processed_count += 1
+            except Exception as e:
+                self.logger.error(f"메시지 처리 오류: {message_id}, {str(e)}")
+                error_count += 1
+        
+        return new_mails, processed_count, error_count
+    
+    def _build_mail_data(self, account_id: UUID, mail: Mail) -> Dict:
+        """
+        외부 API로 전송할 메일 데이터를 구성합니다.
+        
+        Args:
+            account_id: 계정 ID
+            mail: 저장된 메일
+            
+        Returns:
+            전송할 메일 데이터
+        """
+        return {
+            "account_id": str(account_id),
+            "message_id": mail.message_id,
+            "subject": mail.subject,
+            "sender": mail.sender,
+            "recipients": mail.recipients,
+            "received_at": mail.received_at.isoformat(),
+            "body_preview": mail.body_preview,
+        }
+    
+    def _cache_mail(self, mail: Mail) -> None:
+        """조회한 메일을 캐시에 저장합니다. (LRU 방식으로 크기 제한)"""
+        cache_key = (mail.account_id, mail.message_id)
+        self._mail_cache[cache_key] = mail.model_copy()
+        self._mail_cache.move_to_end(cache_key)
+        if len(self._mail_cache) > MAIL_CACHE_SIZE:
+            self._mail_cache.popitem(last=False)
+    
+    def _invalidate_mail(self, account_id: UUID, message_id: str) -> None:
+        """캐시된 메일을 무효화합니다."""
+        self._mail_cache.pop((account_id, message_id), None)
+    
+    async def _load_auth_context(
+        self,
+        account_id: UUID,
+        refresh_expired: bool = False,
+    ) -> Tuple[Account, Token, str]:
+        """
+        계정, 토큰, 복호화된 액세스 토큰을 조회합니다.
+        
+        계정 상태는 매번 확인하고, 토큰만 연속된 작업에서 반복 조회하지 않도록 잠시 캐시합니다.
+        
+        Args:
+            account_id: 계정 ID
+            refresh_expired: 만료된 토큰 갱신 여부 (False면 만료 시 ValueError)
+            
+        Returns:
+            (계정, 토큰, 복호화된 액세스 토큰)
+            
+        Raises:
+            ValueError: 계정이나 토큰이 없거나 사용할 수 없는 경우
+        """
+        # 계정 상태는 비활성화 등이 바로 반영되도록 캐시하지 않고 매번 확인
+        account = await self.account_repository.get_by_id(account_id)
+        if not account:
+            raise ValueError(f"계정을 찾을 수 없습니다: {account_id}")
+        
+        if not account.can_sync():
+            raise ValueError(f"사용할 수 없는 계정 상태입니다: {account_id}, {account.status}")
+        
+        entry = self._token_cache.get(account_id)
+        if entry is not None and time.monotonic() - entry[0] < TOKEN_CACHE_TTL_SECONDS:
+            token = entry[1]
+        else:
+            # 데이터베이스에서 토큰 조회
+            token = await self.token_repository.get_by_account_id(account_id)
+            if not token:
+                raise ValueError(f"토큰을 찾을 수 없습니다: {account_id}")
+            
+            if len(self._token_cache) >= TOKEN_CACHE_SIZE:
+                self._token_cache.clear()
+            self._token_cache[account_id] = (time.monotonic(), token)
+        
+        # 토큰 만료 확인 및 갱신
+        if token.is_expired():
+            if not refresh_expired:
+                raise ValueError(f"토큰이 만료되었습니다: {account_id}")
+            
+            self.logger.info(f"토큰이 만료되어 갱신 시도: {account_id}")
+            token = await self.authentication_usecase.refresh_token(account_id)
+            if not token:
+                raise ValueError(f"토큰 갱신에 실패했습니다: {account_id}")
+            self._token_cache[account_id] = (time.monotonic(), token)
+        
+        # 복호화 결과는 인증 유즈케이스의 캐시를 공유 (토큰 저장/폐기 시 함께 무효화됨)
+        return account, token, await self.authentication_usecase._decrypted_access(token)
     
     def _convert_message_to_mail(self, account_id: UUID, message_data: Dict) -> Mail:
         """
@@ -483,89 +770,55 @@ class MailProcessingUseCase:
         Returns:
             Mail 엔티티
         """
-        # 수신자 정보 추출
-        to_recipients = []
-        cc_recipients = []
-        bcc_recipients = []
-        
-        for recipient in message_data.get('toRecipients', []):
-            email = recipient.get('emailAddress', {}).get('address')
-            if email:
-                to_recipients.append(email)
+        get = message_data.get
         
-        for recipient in message_data.get('ccRecipients', []):
-            email = recipient.get('emailAddress', {}).get('address')
-            if email:
-                cc_recipients.append(email)
-        
-        for recipient in message_data.get('bccRecipients', []):
-            email = recipient.get('emailAddress', {}).get('address')
-            if email:
-                bcc_recipients.append(email)
+        # 수신자 정보 추출
+        to_recipients = [
+            email for recipient in get('toRecipients', ())
+            if (email := recipient.get('emailAddress', _EMPTY).get('address'))
+        ]
+        cc_recipients = [
+            email for recipient in get('ccRecipients', ())
+            if (email := recipient.get('emailAddress', _EMPTY).get('address'))
+        ]
+        bcc_recipients = [
+            email for recipient in get('bccRecipients', ())
+            if (email := recipient.get('emailAddress', _EMPTY).get('address'))
+        ]
         
         # 발신자 정보 추출
-        sender = None
-        sender_data = message_data.get('sender', {}).get('emailAddress')
-        if sender_data:
-            sender = sender_data.get('address')
+        sender = (get('sender') or _EMPTY).get('emailAddress', _EMPTY).get('address')
         
         # 본문 정보 추출
-        body = message_data.get('body', {})
+        body = get('body', _EMPTY)
         body_content = body.get('content')
         body_content_type = body.get('contentType')
         
         # 날짜 파싱
-        received_datetime_str = message_data.get('receivedDateTime')
-        received_at = datetime.fromisoformat(received_datetime_str.replace('Z', '+00:00')) if received_datetime_str else datetime.utcnow()
+        received_datetime_str = get('receivedDateTime')
+        received_at = _parse_graph_datetime(received_datetime_str) if received_datetime_str else datetime.utcnow()
         
-        sent_datetime_str = message_data.get('sentDateTime')
-        sent_at = datetime.fromisoformat(sent_datetime_str.replace('Z', '+00:00')) if sent_datetime_str else None
+        sent_datetime_str = get('sentDateTime')
+        sent_at = _parse_graph_datetime(sent_datetime_str) if sent_datetime_str else None
         
         return Mail(
             account_id=account_id,
-            message_id=message_data.get('id'),
-            subject=message_data.get('subject'),
+            message_id=get('id'),
+            subject=get('subject'),
             sender=sender,
             recipients=to_recipients,
             cc_recipients=cc_recipients,
             bcc_recipients=bcc_recipients,
-            body_preview=message_data.get('bodyPreview'),
+            body_preview=get('bodyPreview'),
             body_content=body_content,
             body_content_type=body_content_type,
-            importance=message_data.get('importance'),
-            is_read=message_data.get('isRead', False),
-            has_attachments=message_data.get('hasAttachments', False),
+            importance=get('importance'),
+            is_read=get('isRead', False),
+            has_attachments=get('hasAttachments', False),
             received_at=received_at,
             sent_at=sent_at,
         )
     
-    def _build_date_filter(
-        self,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime],
-    ) -> str:
-        """
-        날짜 필터 쿼리를 구성합니다.
-        
-        Args:
-            start_date: 시작 날짜
-            end_date: 종료 날짜
-            
-        Returns:
-            OData 필터 쿼리
-        """
-        filters = []
-        
-        if start_date:
-            start_str = start_date.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-            filters.append(f"receivedDateTime ge {start_str}")
-        
-        if end_date:
-            end_str = end_date.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-            filters.append(f"receivedDateTime le {end_str}")
-        
-        return " and ".join(filters)
-    
     async def get_sync_history(
         self,
         account_id: UUID,
@@ -0,0 +1,65 @@
+"""
+테스트용 인메모리 포트 구현
+
+포트 docstring에 정의된 동작(빈 목록, 중복 메시지 ID, 전부 저장 또는 전부 실패)을 그대로 따릅니다.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from core.domain.entities import Mail
+
+
+class InMemoryMailRepository:
+    """MailRepositoryPort 인메모리 구현"""
+    
+    def __init__(self):
+        self.mails: Dict[Tuple[UUID, str], Mail] = {}
+        self.fail_create = False
+    
+    async def exists_many(self, account_id: UUID, message_ids: List[str]) -> Set[str]:
+        return {
+            message_id for message_id in message_ids
+            if (account_id, message_id) in self.mails
+        }
+    
+    async def create_many(self, mails: List[Mail]) -> List[Mail]:
+        keys = [(mail.account_id, mail.message_id) for mail in mails]
+        if self.fail_create or len(set(keys)) < len(keys) or any(key in self.mails for key in keys):
+            raise ValueError("이미 저장된 메일이 있습니다")
+        
+        for key, mail in zip(keys, mails):
+            self.mails[key] = mail
+        return list(mails)
+    
+    async def mark_processed_many(self, mail_ids: List[UUID]) -> int:
+        ids = set(mail_ids)
+        updated = 0
+        for mail in self.mails.values():
+            if mail.id in ids:
+                mail.mark_as_processed()
+                updated += 1
+        return updated
+    
+    async def get_by_message_id(self, account_id: UUID, message_id: str) -> Optional[Mail]:
+        return self.mails.get((account_id, message_id))
+
+
+class FakeExternalApiClient:
+    """ExternalApiClientPort 테스트 구현 (failing_ids의 메시지는 전송 실패)"""
+    
+    def __init__(self, failing_ids: Set[str] = frozenset(), bulk_error: Optional[Exception] = None):
+        self.failing_ids = set(failing_ids)
+        self.bulk_error = bulk_error
+        self.sent: List[str] = []
+    
+    async def send_mail_data(self, mail_data: dict) -> bool:
+        if mail_data["message_id"] in self.failing_ids:
+            return False
+        self.sent.append(mail_data["message_id"])
+        return True
+    
+    async def send_mail_data_bulk(self, items: List[dict]) -> List[bool]:
+        if self.bulk_error is not None:
+            raise self.bulk_error
+        return [await self.send_mail_data(item) for item in items]
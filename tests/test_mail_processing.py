@@ -0,0 +1,115 @@
+"""
+MailProcessingUseCase._process_messages 테스트
+
+인메모리 저장소로 exists_many/create_many/mark_processed_many 포트 계약에 맞게 동작하는지 확인합니다.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from adapters.logger import create_logger
+from core.usecases.mail_processing import MailProcessingUseCase
+from tests.fakes import FakeExternalApiClient, InMemoryMailRepository
+
+
+def _message(message_id: str) -> dict:
+    return {
+        "id": message_id,
+        "subject": f"제목 {message_id}",
+        "sender": {"emailAddress": {"address": "sender@example.com"}},
+        "toRecipients": [{"emailAddress": {"address": "to@example.com"}}],
+        "bodyPreview": "미리보기",
+        "receivedDateTime": "2024-01-02T03:04:05Z",
+        "sentDateTime": "2024-01-02T03:04:00Z",
+    }
+
+
+def _usecase(mail_repository, external_api_client) -> MailProcessingUseCase:
+    return MailProcessingUseCase(
+        account_repository=None,
+        token_repository=None,
+        mail_repository=mail_repository,
+        sync_history_repository=None,
+        delta_link_repository=None,
+        graph_api_client=None,
+        encryption_service=None,
+        external_api_client=external_api_client,
+        authentication_usecase=None,
+        logger=create_logger("test_mail_processing", "WARNING"),
+    )
+
+
+@pytest.fixture
+def account_id():
+    return uuid4()
+
+
+async def test_new_messages_are_stored_sent_and_marked_processed(account_id):
+    repository = InMemoryMailRepository()
+    external = FakeExternalApiClient()
+    usecase = _usecase(repository, external)
+    
+    result = await usecase._process_messages(account_id, [_message("m1"), _message("m2")])
+    
+    assert result == (2, 0)
+    assert external.sent == ["m1", "m2"]
+    assert all(mail.is_processed() for mail in repository.mails.values())
+
+
+async def test_already_stored_messages_are_skipped(account_id):
+    repository = InMemoryMailRepository()
+    external = FakeExternalApiClient()
+    usecase = _usecase(repository, external)
+    await usecase._process_messages(account_id, [_message("m1")])
+    
+    # 이미 저장된 메일도 처리 건수에 포함되지만 다시 저장/전송하지는 않음
+    result = await usecase._process_messages(account_id, [_message("m1"), _message("m2")])
+    
+    assert result == (2, 0)
+    assert external.sent == ["m1", "m2"]
+    assert len(repository.mails) == 2
+
+
+async def test_empty_page_does_nothing(account_id):
+    repository = InMemoryMailRepository()
+    external = FakeExternalApiClient()
+    usecase = _usecase(repository, external)
+    
+    assert await usecase._process_messages(account_id, []) == (0, 0)
+    assert external.sent == []
+
+
+async def test_failed_insert_sends_nothing(account_id):
+    repository = InMemoryMailRepository()
+    repository.fail_create = True
+    external = FakeExternalApiClient()
+    usecase = _usecase(repository, external)
+    
+    result = await usecase._process_messages(account_id, [_message("m1"), _message("m2")])
+    
+    assert result == (0, 2)
+    assert external.sent == []
+    assert repository.mails == {}
+
+
+async def test_failed_sends_stay_unprocessed(account_id):
+    repository = InMemoryMailRepository()
+    external = FakeExternalApiClient(failing_ids={"m2"})
+    usecase = _usecase(repository, external)
+    
+    await usecase._process_messages(account_id, [_message("m1"), _message("m2")])
+    
+    assert repository.mails[(account_id, "m1")].is_processed()
+    assert not repository.mails[(account_id, "m2")].is_processed()
+
+
+async def test_bulk_send_error_falls_back_to_individual_sends(account_id):
+    repository = InMemoryMailRepository()
+    external = FakeExternalApiClient(bulk_error=RuntimeError("일시적 오류"))
+    usecase = _usecase(repository, external)
+    
+    await usecase._process_messages(account_id, [_message("m1"), _message("m2")])
+    
+    assert sorted(external.sent) == ["m1", "m2"]
+    assert all(mail.is_processed() for mail in repository.mails.values())
@@ -0,0 +1,170 @@
+"""
+계정/인증 설정 Repository 어댑터 테스트
+
+인메모리 SQLite(aiosqlite)에서 UPDATE ... RETURNING, 조건 조합 조회, 외부 조인 조회를 확인합니다.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from adapters.db.models import Base
+from adapters.db.repositories import AccountRepositoryAdapter, AuthConfigRepositoryAdapter
+from core.domain.entities import (
+    Account,
+    AccountStatus,
+    AuthCodeConfig,
+    AuthType,
+    DeviceCodeConfig,
+)
+from core.domain.ports import AccountFilter
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    
+    await engine.dispose()
+
+
+def _account(email: str, auth_type: AuthType, status: AccountStatus = AccountStatus.INACTIVE) -> Account:
+    return Account(email=email, auth_type=auth_type, status=status)
+
+
+def _config(account: Account):
+    if account.auth_type == AuthType.AUTHORIZATION_CODE:
+        return AuthCodeConfig(
+            account_id=account.id,
+            client_id="client",
+            client_secret="secret",
+            redirect_uri="http://localhost:5000/auth/callback",
+            tenant_id="tenant",
+        )
+    return DeviceCodeConfig(account_id=account.id, client_id="client", tenant_id="tenant")
+
+
+async def _create(session, email, auth_type, status=AccountStatus.INACTIVE) -> Account:
+    account = _account(email, auth_type, status)
+    return await AccountRepositoryAdapter(session).create_with_config(account, _config(account))
+
+
+async def test_update_status_returns_updated_account(session):
+    repository = AccountRepositoryAdapter(session)
+    account = await _create(session, "user@example.com", AuthType.AUTHORIZATION_CODE)
+    
+    updated = await repository.update_status(account.id, AccountStatus.ACTIVE)
+    
+    assert updated.id == account.id
+    assert updated.status == AccountStatus.ACTIVE
+    assert (await repository.get_by_id(account.id)).status == AccountStatus.ACTIVE
+
+
+async def test_update_status_returns_none_for_missing_account(session):
+    repository = AccountRepositoryAdapter(session)
+    
+    assert await repository.update_status(uuid4(), AccountStatus.ACTIVE) is None
+
+
+async def test_update_last_sync_at_keeps_other_columns(session):
+    repository = AccountRepositoryAdapter(session)
+    account = await _create(session, "user@example.com", AuthType.AUTHORIZATION_CODE)
+    await repository.update_status(account.id, AccountStatus.ERROR)
+    
+    assert await repository.update_last_sync_at(account.id, account.created_at)
+    
+    stored = await repository.get_by_id(account.id)
+    assert stored.last_sync_at == account.created_at
+    assert stored.status == AccountStatus.ERROR
+    assert not await repository.update_last_sync_at(uuid4(), account.created_at)
+
+
+async def test_create_with_config_duplicate_email_raises_value_error(session):
+    await _create(session, "user@example.com", AuthType.AUTHORIZATION_CODE)
+    
+    with pytest.raises(ValueError):
+        await _create(session, "user@example.com", AuthType.DEVICE_CODE)
+    
+    # 실패한 등록은 계정/설정 모두 롤백
+    accounts = await AccountRepositoryAdapter(session).list(AccountFilter())
+    assert [account.auth_type for account in accounts] == [AuthType.AUTHORIZATION_CODE]
+
+
+async def test_create_with_config_other_integrity_errors_are_not_mapped(session):
+    repository = AccountRepositoryAdapter(session)
+    existing = await _create(session, "user@example.com", AuthType.AUTHORIZATION_CODE)
+    
+    # 다른 계정의 설정 행과 기본 키가 겹치는 경우는 중복 계정 오류가 아님
+    account = _account("other@example.com", AuthType.AUTHORIZATION_CODE)
+    config = _config(existing)
+    with pytest.raises(IntegrityError):
+        await repository.create_with_config(account, config)
+
+
+async def test_list_combines_filters(session):
+    repository = AccountRepositoryAdapter(session)
+    await _create(session, "active-code@example.com", AuthType.AUTHORIZATION_CODE, AccountStatus.ACTIVE)
+    await _create(session, "active-device@example.com", AuthType.DEVICE_CODE, AccountStatus.ACTIVE)
+    await _create(session, "error-code@example.com", AuthType.AUTHORIZATION_CODE, AccountStatus.ERROR)
+    
+    def emails(accounts):
+        return sorted(account.email for account in accounts)
+    
+    assert len(await repository.list(AccountFilter())) == 3
+    assert emails(await repository.list(AccountFilter(active_only=True))) == [
+        "active-code@example.com",
+        "active-device@example.com",
+    ]
+    assert emails(
+        await repository.list(AccountFilter(active_only=True, auth_type=AuthType.AUTHORIZATION_CODE))
+    ) == ["active-code@example.com"]
+    assert emails(
+        await repository.list(AccountFilter(status=AccountStatus.ERROR, auth_type=AuthType.AUTHORIZATION_CODE))
+    ) == ["error-code@example.com"]
+    assert await repository.list(AccountFilter(status=AccountStatus.ERROR, auth_type=AuthType.DEVICE_CODE)) == []
+    assert len(await repository.list(AccountFilter(), skip=1, limit=1)) == 1
+
+
+async def test_stream_active_yields_only_active_accounts(session):
+    repository = AccountRepositoryAdapter(session)
+    await _create(session, "active@example.com", AuthType.AUTHORIZATION_CODE, AccountStatus.ACTIVE)
+    await _create(session, "inactive@example.com", AuthType.AUTHORIZATION_CODE)
+    
+    emails = [account.email async for account in repository.stream_active(batch_size=1)]
+    
+    assert emails == ["active@example.com"]
+
+
+async def test_get_account_with_config_returns_config_of_account_auth_type(session):
+    repository = AuthConfigRepositoryAdapter(session)
+    code_account = await _create(session, "code@example.com", AuthType.AUTHORIZATION_CODE)
+    device_account = await _create(session, "device@example.com", AuthType.DEVICE_CODE)
+    
+    account, config = await repository.get_account_with_config(code_account.id)
+    assert account.id == code_account.id
+    assert isinstance(config, AuthCodeConfig)
+    
+    account, config = await repository.get_account_with_config(device_account.id)
+    assert account.id == device_account.id
+    assert isinstance(config, DeviceCodeConfig)
+    
+    assert await repository.get_account_with_config(uuid4()) == (None, None)
+
+
+async def test_get_configs_for_accounts_returns_config_per_account(session):
+    repository = AuthConfigRepositoryAdapter(session)
+    code_account = await _create(session, "code@example.com", AuthType.AUTHORIZATION_CODE)
+    device_account = await _create(session, "device@example.com", AuthType.DEVICE_CODE)
+    
+    configs = await repository.get_configs_for_accounts([code_account.id, device_account.id, uuid4()])
+    
+    assert set(configs) == {code_account.id, device_account.id}
+    assert isinstance(configs[code_account.id], AuthCodeConfig)
+    assert isinstance(configs[device_account.id], DeviceCodeConfig)
+    assert await repository.get_configs_for_accounts([]) == {}
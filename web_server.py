@@ -5,148 +5,161 @@ Microsoft 365 인증을 위한 웹 인터페이스를 제공합니다.
 """
 
 import asyncio
+import gzip
+import hashlib
+import inspect
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import anyio
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+from starlette.routing import Route
 
 from adapters.web.auth_routes import router as auth_router
-from adapters.db.database import initialize_database
+from adapters.db.database import get_database_adapter, initialize_database
+from adapters.external.graph_api_client import GraphApiClientAdapter
 from adapters.logger import create_logger
 from config.adapters import get_config
 
+try:
+    import uvloop  # noqa: F401
+    _UVICORN_LOOP = "uvloop"
+except ImportError:  # Windows 등 uvloop 미지원 환경
+    _UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+try:
+    # 설치되어 있으면 더 빠른 orjson으로 JSON 응답 직렬화 (pip install .[fast])
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    _DefaultResponse = JSONResponse
+
+# 설정 로드 (프로세스당 한 번 조회해 모듈 전체에서 재사용)
+config = get_config()
+
+# 로거 설정
+logger = create_logger("web_server")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 리소스를 초기화하고 정리합니다."""
+    logger.info("FastAPI 웹 서버 시작")
+    
+    # 데이터베이스 연결 초기화 (테이블 생성은 서버 시작 전 `python main.py db init`으로 한 번만 수행)
+    db_adapter = initialize_database(config)
+    await db_adapter.initialize()
+    
+    # 동기 핸들러/의존성이 기본 한도(40)에서 대기하지 않도록 스레드풀 한도 조정
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = config.get_web_threadpool_tokens()
+    
+    logger.info(f"환경: {config.get_environment()}")
+    logger.info(f"데이터베이스: {config.get_database_url()}")
+    logger.info(f"스레드풀 한도: {limiter.total_tokens}")
+    logger.info("웹 서버 준비 완료")
+    
+    yield
+    
+    logger.info("FastAPI 웹 서버 종료")
+    
+    # 데이터베이스 연결과 Graph API HTTP 커넥션 풀은 서로 독립적이므로 동시에 종료
+    await asyncio.gather(db_adapter.close(), GraphApiClientAdapter.aclose())
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Microsoft 365 Graph API 인증 서비스",
     description="OAuth 2.0 인증을 위한 웹 인터페이스",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=_DefaultResponse,
+    # API 문서/스키마는 디버그 모드에서만 노출
+    docs_url="/docs" if config.is_debug() else None,
+    redoc_url=None,
+    openapi_url="/openapi.json" if config.is_debug() else None,
 )
 
-# CORS 설정
+
+class AuthCORSMiddleware(CORSMiddleware):
+    """인증 API(/auth) 경로에만 CORS를 적용합니다. (홈페이지/정적 파일은 그대로 통과)"""
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(auth_router.prefix):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+# CORS 설정 (허용 오리진/메서드/헤더를 실제 사용 범위로 제한하고 preflight 응답은 하루 동안 캐시)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 도메인만 허용
+    AuthCORSMiddleware,
+    allow_origins=config.get_web_cors_origins(),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
-# 로거 설정
-logger = create_logger("web_server")
+class NonRootGZipMiddleware(GZipMiddleware):
+    """홈페이지(/)를 제외한 응답을 압축합니다. (홈페이지는 핸들러가 직접 압축본/Vary 헤더를 선택)"""
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/":
+            await self.app(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+
+# 응답 압축 (/docs, OpenAPI 스키마 등)
+app.add_middleware(NonRootGZipMiddleware, minimum_size=500, compresslevel=6)
 
 # 라우터 등록
 app.include_router(auth_router)
 
+# 인증 라우트는 요청마다 스레드풀로 넘어가지 않도록 모두 async 핸들러여야 함
+_sync_auth_routes = [
+    route.path for route in auth_router.routes
+    if not inspect.iscoroutinefunction(getattr(route, "endpoint", None))
+]
+if _sync_auth_routes:
+    raise RuntimeError(f"동기 인증 핸들러는 허용되지 않습니다: {_sync_auth_routes}")
 
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 실행되는 이벤트"""
-    logger.info("FastAPI 웹 서버 시작")
-    
-    # 데이터베이스 초기화
-    config = get_config()
-    db_adapter = initialize_database(config)
-    await db_adapter.initialize()
-    await db_adapter.create_tables()
-    
-    logger.info(f"환경: {config.get_environment()}")
-    logger.info(f"데이터베이스: {config.get_database_url()}")
-    logger.info("웹 서버 준비 완료")
+# 정적 파일 (URL에 내용 해시를 붙여 참조하므로 브라우저/CDN이 영구 캐시해도 안전)
+STATIC_DIR = Path(__file__).resolve().parent / "static"
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """서버 종료 시 실행되는 이벤트"""
-    logger.info("FastAPI 웹 서버 종료")
+class ImmutableStaticFiles(StaticFiles):
+    """장기 캐시 헤더를 붙여 정적 파일을 제공합니다."""
     
-    # 데이터베이스 연결 종료
-    from adapters.db.database import get_database_adapter
-    db_adapter = get_database_adapter()
-    if db_adapter:
-        await db_adapter.close()
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 
+app.mount("/static", ImmutableStaticFiles(directory=STATIC_DIR), name="static")
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """홈페이지"""
-    html_content = """
+_ROOT_CSS_VERSION = hashlib.sha256((STATIC_DIR / "root.css").read_bytes()).hexdigest()[:12]
+
+# 홈페이지 HTML (정적 페이지이므로 응답을 한 번만 생성해 재사용)
+_ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>Microsoft 365 Graph API 인증 서비스</title>
-        <style>
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                padding: 40px;
-                max-width: 800px;
-                margin: 0 auto;
-                background: #f5f5f5;
-            }
-            .container {
-                background: white;
-                padding: 40px;
-                border-radius: 12px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            }
-            h1 {
-                color: #0078d4;
-                margin-bottom: 30px;
-            }
-            .auth-methods {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 20px;
-                margin-top: 30px;
-            }
-            .auth-card {
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 8px;
-                border: 1px solid #e0e0e0;
-            }
-            .auth-card h2 {
-                color: #323130;
-                margin-bottom: 15px;
-            }
-            .auth-card p {
-                color: #605e5c;
-                line-height: 1.5;
-            }
-            .start-btn {
-                display: inline-block;
-                margin-top: 15px;
-                padding: 10px 20px;
-                background: #0078d4;
-                color: white;
-                text-decoration: none;
-                border-radius: 4px;
-                transition: background 0.2s;
-            }
-            .start-btn:hover {
-                background: #106ebe;
-            }
-            .status-check {
-                margin-top: 40px;
-                padding: 20px;
-                background: #e7f3ff;
-                border-radius: 8px;
-            }
-            input[type="email"] {
-                padding: 8px 12px;
-                border: 1px solid #8a8886;
-                border-radius: 4px;
-                width: 300px;
-                margin-right: 10px;
-            }
-            .check-btn {
-                padding: 8px 16px;
-                background: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                cursor: pointer;
-            }
-        </style>
+        <link rel="stylesheet" href="/static/root.css?v=__ROOT_CSS_VERSION__">
     </head>
     <body>
         <div class="container">
@@ -219,24 +232,58 @@ async def root():
     </body>
     </html>
     """
-    return HTMLResponse(content=html_content)
+
+_ROOT_HTML_BYTES = _ROOT_HTML.replace("__ROOT_CSS_VERSION__", _ROOT_CSS_VERSION).encode("utf-8")
+# 압축 여부와 무관하게 같은 내용이므로 약한(weak) ETag 하나를 공유
+_ROOT_ETAG = 'W/"' + hashlib.blake2b(_ROOT_HTML_BYTES, digest_size=8).hexdigest() + '"'
+_ROOT_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "Vary": "Accept-Encoding",
+    "ETag": _ROOT_ETAG,
+}
+_ROOT_GZIP_HEADERS = {**_ROOT_HEADERS, "Content-Encoding": "gzip"}
+
+# gzip 압축본도 시작 시 한 번만 만들어 두어 요청마다 압축하지 않음
+_ROOT_GZIP_BYTES = gzip.compress(_ROOT_HTML_BYTES, compresslevel=6)
+
+
+async def root(request: Request):
+    """홈페이지 (FastAPI 의존성/파라미터 처리 없이 Starlette 라우트로 직접 제공)"""
+    # 본문/헤더는 미리 만들어 두고 Response는 요청마다 새로 생성
+    # (GZipMiddleware 등 미들웨어가 응답 헤더를 제자리에서 수정하므로 객체를 공유하면 안 됨)
+    # 브라우저 캐시가 최신이면 본문 없이 304 응답
+    if _ROOT_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(content=_ROOT_GZIP_BYTES, headers=_ROOT_GZIP_HEADERS)
+    return HTMLResponse(content=_ROOT_HTML_BYTES, headers=_ROOT_HEADERS)
+
+
+# 가장 많이 호출되는 경로이므로 라우트 목록 맨 앞에 두어 먼저 매칭되도록 함
+app.router.routes.insert(0, Route("/", root, methods=["GET"]))
 
 
-@app.get("/docs", include_in_schema=False)
-async def custom_swagger_ui_html():
-    """API 문서 페이지"""
-    return app.swagger_ui_html
+@app.get("/healthz/ready", include_in_schema=False)
+async def readiness():
+    """준비 상태 확인 (데이터베이스 연결 및 테이블이 준비되기 전에는 503)"""
+    if await get_database_adapter().is_ready():
+        return {"status": "ready"}
+    return JSONResponse(status_code=503, content={"status": "not_ready"})
 
 
 if __name__ == "__main__":
-    # 설정 로드
-    config = get_config()
+    # 디버그 모드는 자동 재시작(reload)을 사용하므로 단일 워커로 실행 (reload와 workers는 함께 사용 불가)
+    reload = config.is_debug()
+    workers = 1 if reload else config.get_web_workers()
     
     # 서버 실행
     uvicorn.run(
         "web_server:app",
         host="0.0.0.0",
         port=5000,
-        reload=config.is_debug(),
+        reload=reload,
+        workers=workers,
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
         log_level=config.get_log_level().lower(),
     )